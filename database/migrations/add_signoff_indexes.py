@@ -0,0 +1,57 @@
+# database/migrations/add_signoff_indexes.py
+# ============================================================================
+# MIGRATION: SIGN-OFF PACKAGE INDEXES
+# ============================================================================
+# PURPOSE: Add the indexes the UAT sign-off package queries rely on
+#          (reporters/generate_uat_signoff_package_mcp.py) to the MCP
+#          server's uat_assignments and test_cases tables.
+#
+#   idx_ua_cycle      - "WHERE ua.cycle_id = ?" seeks straight to the
+#                       cycle's assignments and carries test_id for the join
+#   idx_tc_story_test - makes the test_cases side of the join and the
+#                       story_id ORDER BY index-driven
+#
+# ANALYZE refreshes planner statistics so SQLite actually picks them.
+#
+# Run once per database (idempotent), or add SIGNOFF_INDEXES_SQL to the MCP
+# server's schema setup. The sign-off tool itself only reads - it works
+# without these indexes, just with full scans.
+#
+# USAGE:
+#   python -m database.migrations.add_signoff_indexes [db_path]
+#   (db_path defaults to the shared database from get_database_path())
+#
+# ============================================================================
+
+import sqlite3
+import sys
+from contextlib import closing
+
+from database.db_manager import get_database_path
+
+
+SIGNOFF_INDEXES_SQL = """
+    CREATE INDEX IF NOT EXISTS idx_ua_cycle ON uat_assignments(cycle_id, test_id);
+    CREATE INDEX IF NOT EXISTS idx_tc_story_test ON test_cases(story_id, test_id);
+    ANALYZE uat_assignments;
+    ANALYZE test_cases;
+"""
+
+
+def apply(conn: sqlite3.Connection) -> None:
+    """
+    PURPOSE:
+        Create the sign-off indexes and refresh planner statistics.
+
+    PARAMETERS:
+        conn (sqlite3.Connection): Writable connection to the MCP server's
+                                   database
+    """
+    conn.executescript(SIGNOFF_INDEXES_SQL)
+
+
+if __name__ == "__main__":
+    db_path = sys.argv[1] if len(sys.argv) > 1 else str(get_database_path())
+    with closing(sqlite3.connect(db_path)) as conn:
+        apply(conn)
+    print(f"Sign-off indexes ready: {db_path}")
@@ -184,6 +184,49 @@ CREATE INDEX IF NOT EXISTS idx_tests_assigned ON uat_test_cases(assigned_to);
 CREATE INDEX IF NOT EXISTS idx_tests_change ON uat_test_cases(change_id);
 CREATE INDEX IF NOT EXISTS idx_tests_persona ON uat_test_cases(persona);
 
+-- Covering index for the per-cycle dashboard aggregation
+-- (scripts/generate_dashboard.py): filter by cycle, group by tester,
+-- count statuses and MAX(tested_date) without touching the table.
+-- Partial - tests outside a UAT cycle never enter it.
+CREATE INDEX IF NOT EXISTS idx_tc_cycle_assignee_status
+    ON uat_test_cases(uat_cycle_id, assigned_to, test_status, tested_date)
+    WHERE uat_cycle_id IS NOT NULL;
+
+-- Workflow export (scripts/export_workflow_json.py): ONB tests by
+-- section in walkthrough order. Partial on the same LIKE the export uses.
+CREATE INDEX IF NOT EXISTS idx_tc_workflow
+    ON uat_test_cases(workflow_section, workflow_order)
+    WHERE test_id LIKE 'ONB-%';
+
+
+-- ============================================================================
+-- UAT TEST ASSIGNMENTS TABLE
+-- ============================================================================
+-- One row per (test, tester, assignment type). uat_test_cases.assigned_to holds a
+-- single assignee, so cross-checks (a second tester validating the same
+-- test) are recorded here alongside the primary assignments.
+-- Written by scripts/assign_nccn_testers.py, which also creates it.
+-- Tester trackers list both kinds (cross-checks labelled); dashboard
+-- per-tester totals count primary assignments only.
+--
+-- AVIATION ANALOGY:
+--   Like a crew roster - the pilot in command and the check pilot are
+--   both listed against the same flight.
+
+CREATE TABLE IF NOT EXISTS uat_test_assignments (
+    cycle_id TEXT NOT NULL,                 -- FK to uat_cycles
+    test_id TEXT NOT NULL,                  -- FK to uat_test_cases
+    assigned_to TEXT NOT NULL,              -- Tester email
+    assignment_type TEXT NOT NULL,          -- 'primary', 'cross_check'
+    PRIMARY KEY (cycle_id, test_id, assigned_to, assignment_type)
+);
+
+-- Per-tester tracker queries (scripts/generate_tester_trackers.py):
+-- one cycle's assignments in tester order, covering the tester list and
+-- the join to uat_test_cases.
+CREATE INDEX IF NOT EXISTS idx_assignments_cycle_tester
+    ON uat_test_assignments(cycle_id, assigned_to, test_id, assignment_type);
+
 
 -- ============================================================================
 -- VIEWS
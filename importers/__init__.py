@@ -3,14 +3,32 @@
 # UAT TOOLKIT IMPORTERS PACKAGE
 # ============================================================================
 # Provides Excel import functions for UAT test profiles and notation parsing.
+#
+# The re-exports below are resolved lazily (PEP 562 module __getattr__), so
+# importing one importer - e.g. importers.nccn_notation_parser for
+# `run.py parse-notation` - doesn't also load nccn_importer and openpyxl.
 
-from .nccn_importer import import_nccn_profiles, import_nccn_assignments
-from .nccn_notation_parser import parse_test_notation, notation_to_dict, validate_notation
+from importlib import import_module
 
-__all__ = [
-    'import_nccn_profiles',
-    'import_nccn_assignments',
-    'parse_test_notation',
-    'notation_to_dict',
-    'validate_notation',
-]
+# Public name -> submodule that defines it
+_EXPORTS = {
+    'import_nccn_profiles': '.nccn_importer',
+    'import_nccn_assignments': '.nccn_importer',
+    'parse_test_notation': '.nccn_notation_parser',
+    'notation_to_dict': '.nccn_notation_parser',
+    'validate_notation': '.nccn_notation_parser',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -3,8 +3,30 @@
 # UAT TOOLKIT REPORTERS PACKAGE
 # ============================================================================
 # Provides report generation and export functions.
+#
+# The re-exports below are resolved lazily (PEP 562 module __getattr__), so
+# importing one reporter - e.g. reporters.cycle_summary for `run.py status` -
+# doesn't also load excel_export and openpyxl.
 
-from .cycle_summary import get_dashboard_report, get_progress_report
-from .excel_export import export_uat_results
+from importlib import import_module
 
-__all__ = ['get_dashboard_report', 'get_progress_report', 'export_uat_results']
+# Public name -> submodule that defines it
+_EXPORTS = {
+    'get_dashboard_report': '.cycle_summary',
+    'get_progress_report': '.cycle_summary',
+    'export_uat_results': '.excel_export',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
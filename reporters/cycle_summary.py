@@ -14,6 +14,73 @@ from typing import Optional, Dict, List
 from database.db_manager import UATDatabase
 
 
+# ============================================================================
+# FIXED REPORT TEMPLATES
+# ============================================================================
+# The static parts of the dashboard are built once at import time instead of
+# being re-assembled (rules, headings, dict literals) on every report call.
+# Only the data slots ({name}, {passed}, ...) are filled in per call.
+
+_RULE = '=' * 64
+_SECTION_RULE = '─' * 50
+
+_DASHBOARD_HEADER = (
+    f"\n{_RULE}\n"
+    "  UAT CYCLE DASHBOARD\n"
+    f"{_RULE}\n"
+    "  {name}\n"
+    "  {program} | {uat_type} | Status: {status}\n"
+    f"{_RULE}\n"
+)
+
+_TEST_PROGRESS_HEADER = f"\nTEST PROGRESS\n{_SECTION_RULE}\n" + "Total Tests: {total}\n"
+
+_TESTER_PROGRESS_HEADER = f"\nTESTER PROGRESS\n{_SECTION_RULE}\n"
+
+_RETEST_QUEUE_HEADER = "\nRETEST QUEUE ({count} tests)\n" + f"{_SECTION_RULE}\n"
+
+_GATE_SECTION = (
+    f"\nPRE-UAT GATE\n{_SECTION_RULE}\n"
+    "  Items: {completed}/{total} complete\n"
+    "  Required Pending: {required_pending}\n"
+    "  Gate Passed: {gate_passed}\n"
+)
+
+_DECISION_SECTION = (
+    f"\nGO/NO-GO DECISION\n{_SECTION_RULE}\n"
+    "  Decision: {decision}\n"
+    "  Signed by: {signed_by}\n"
+    "  Date: {signed_date}\n"
+)
+
+# Status → display lookups (previously rebuilt per row inside the loops)
+_RETEST_STATUS_ICONS = {
+    'pending': '[---]',
+    'investigating': '[INV]',
+    'fixed': '[FIX]',
+    'wont_fix': '[WNT]',
+    'not_a_bug': '[NAB]'
+}
+
+_DECISION_DISPLAY = {
+    'go': 'GO - Approved',
+    'conditional_go': 'CONDITIONAL GO',
+    'no_go': 'NO-GO - Blocked'
+}
+
+_CYCLE_STATUS_ICONS = {
+    'planning': '[PLAN]',
+    'validation': '[VAL ]',
+    'kickoff': '[KICK]',
+    'testing': '[TEST]',
+    'review': '[REV ]',
+    'retesting': '[RTST]',
+    'decision': '[DEC ]',
+    'complete': '[DONE]',
+    'cancelled': '[CANC]'
+}
+
+
 def get_dashboard_report(cycle_id: str, db_path: str = None) -> str:
     """
     PURPOSE:
@@ -44,14 +111,12 @@ def get_dashboard_report(cycle_id: str, db_path: str = None) -> str:
         retest_queue = db.get_retest_queue(cycle_id)
 
         # Build dashboard
-        result = f"""
-{'=' * 64}
-  UAT CYCLE DASHBOARD
-{'=' * 64}
-  {cycle['name'][:55]}
-  {cycle.get('program_prefix', 'N/A')} | {cycle['uat_type']} | Status: {cycle['status'].upper()}
-{'=' * 64}
-"""
+        result = _DASHBOARD_HEADER.format(
+            name=cycle['name'][:55],
+            program=cycle.get('program_prefix', 'N/A'),
+            uat_type=cycle['uat_type'],
+            status=cycle['status'].upper()
+        )
 
         # Days to launch warning
         days = cycle.get('days_to_launch')
@@ -72,11 +137,7 @@ def get_dashboard_report(cycle_id: str, db_path: str = None) -> str:
         blocked = cycle.get('blocked') or 0
         not_run = cycle.get('not_run') or 0
 
-        result += f"""
-TEST PROGRESS
-{'─' * 50}
-Total Tests: {total}
-"""
+        result += _TEST_PROGRESS_HEADER.format(total=total)
 
         if total > 0:
             # Calculate percentages
@@ -106,10 +167,7 @@ Total Tests: {total}
 
         # Tester Progress Section
         if tester_progress:
-            result += f"""
-TESTER PROGRESS
-{'─' * 50}
-"""
+            result += _TESTER_PROGRESS_HEADER
             for tp in tester_progress:
                 pct = tp.get('completion_pct') or 0
                 bar_len = int(20 * pct / 100)
@@ -122,18 +180,9 @@ TESTER PROGRESS
 
         # Retest Queue Section
         if retest_queue:
-            result += f"""
-RETEST QUEUE ({len(retest_queue)} tests)
-{'─' * 50}
-"""
+            result += _RETEST_QUEUE_HEADER.format(count=len(retest_queue))
             for test in retest_queue[:5]:
-                status_icon = {
-                    'pending': '[---]',
-                    'investigating': '[INV]',
-                    'fixed': '[FIX]',
-                    'wont_fix': '[WNT]',
-                    'not_a_bug': '[NAB]'
-                }.get(test.get('dev_status', 'pending'), '[???]')
+                status_icon = _RETEST_STATUS_ICONS.get(test.get('dev_status', 'pending'), '[???]')
 
                 result += f"  {status_icon} {test['test_id']}\n"
                 if test.get('defect_id'):
@@ -143,29 +192,24 @@ RETEST QUEUE ({len(retest_queue)} tests)
                 result += f"  ... and {len(retest_queue) - 5} more\n"
 
         # Gate Status Section
-        result += f"""
-PRE-UAT GATE
-{'─' * 50}
-  Items: {gate_status.get('completed', 0)}/{gate_status.get('total', 0)} complete
-  Required Pending: {gate_status.get('required_pending', 0)}
-  Gate Passed: {'YES' if cycle.get('pre_uat_gate_passed') else 'NO'}
-"""
+        result += _GATE_SECTION.format(
+            completed=gate_status.get('completed', 0),
+            total=gate_status.get('total', 0),
+            required_pending=gate_status.get('required_pending', 0),
+            gate_passed='YES' if cycle.get('pre_uat_gate_passed') else 'NO'
+        )
 
         # Go/No-Go Decision
         if cycle.get('go_nogo_decision'):
-            decision_display = {
-                'go': 'GO - Approved',
-                'conditional_go': 'CONDITIONAL GO',
-                'no_go': 'NO-GO - Blocked'
-            }.get(cycle['go_nogo_decision'], cycle['go_nogo_decision'])
-
-            result += f"""
-GO/NO-GO DECISION
-{'─' * 50}
-  Decision: {decision_display}
-  Signed by: {cycle.get('go_nogo_signed_by', 'N/A')}
-  Date: {cycle.get('go_nogo_signed_date', 'N/A')}
-"""
+            decision_display = _DECISION_DISPLAY.get(
+                cycle['go_nogo_decision'], cycle['go_nogo_decision']
+            )
+
+            result += _DECISION_SECTION.format(
+                decision=decision_display,
+                signed_by=cycle.get('go_nogo_signed_by', 'N/A'),
+                signed_date=cycle.get('go_nogo_signed_date', 'N/A')
+            )
             if cycle.get('go_nogo_notes'):
                 result += f"  Notes: {cycle['go_nogo_notes'][:60]}\n"
 
@@ -224,17 +268,7 @@ UAT PROGRESS REPORT
 
         # Per-cycle breakdown
         for cycle in cycles:
-            status_icon = {
-                'planning': '[PLAN]',
-                'validation': '[VAL ]',
-                'kickoff': '[KICK]',
-                'testing': '[TEST]',
-                'review': '[REV ]',
-                'retesting': '[RTST]',
-                'decision': '[DEC ]',
-                'complete': '[DONE]',
-                'cancelled': '[CANC]'
-            }.get(cycle['status'], '[????]')
+            status_icon = _CYCLE_STATUS_ICONS.get(cycle['status'], '[????]')
 
             result += f"{status_icon} {cycle['cycle_id']}\n"
             result += f"  {cycle['name']}\n"
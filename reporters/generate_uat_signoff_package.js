@@ -9,6 +9,10 @@
  * Usage:
  *   node generate_uat_signoff_package.js <cycle_id> <client_name> <client_title> [output_dir]
  *
+ *   Cycle data (cycle, stories, testCases, defects) is read as JSON from
+ *   stdin when piped in by the Python MCP tool. With no stdin data the
+ *   script falls back to the sample structure in getCycleData().
+ *
  * Example:
  *   node generate_uat_signoff_package.js "UAT-ONB-12345678" "Kim Childers" "Clinical Program Manager" ~/Downloads
  */
@@ -86,6 +90,19 @@ async function getCycleData(cycleId) {
   };
 }
 
+/**
+ * Read cycle data piped in on stdin by the Python MCP tool.
+ *
+ * @returns {object|null} - Parsed data, or null when nothing was piped in
+ */
+function readStdinData() {
+  if (process.stdin.isTTY) {
+    return null;
+  }
+  const raw = fs.readFileSync(0, 'utf-8');
+  return raw.trim() ? JSON.parse(raw) : null;
+}
+
 // ============================================================================
 // DOCUMENT BUILDING HELPERS
 // ============================================================================
@@ -747,8 +764,13 @@ function generateDocument(cycleId, clientName, clientTitle, data, preparedBy = "
   children.push(createParagraph("Please review each user story and its associated test results. Initial each story to indicate acceptance."));
   children.push(new Paragraph({ spacing: { before: 240 } }));
 
+  // testCasesByStory (story_id -> positions in testCases) is pre-grouped by
+  // the Python caller; fall back to a per-story scan when it's absent.
+  const byStory = data.testCasesByStory;
   for (const story of stories) {
-    const storyTests = testCases.filter(tc => tc.story_id === story.story_id);
+    const storyTests = byStory
+      ? (byStory[story.story_id] || []).map(i => testCases[i])
+      : testCases.filter(tc => tc.story_id === story.story_id);
     children.push(...createStorySection(story, storyTests));
   }
 
@@ -837,9 +859,10 @@ function generateDocument(cycleId, clientName, clientTitle, data, preparedBy = "
  * @param {string} clientTitle - Client title
  * @param {string} outputFormat - "docx" or "pdf" (default: "docx")
  * @param {string} outputDir - Output directory (default: ~/Downloads)
+ * @param {object} cycleData - Pre-queried data (e.g., piped from Python); queried if omitted
  * @returns {string} - Path to generated file and summary
  */
-async function generate_uat_signoff_package(cycleId, clientName, clientTitle, outputFormat = 'docx', outputDir = null) {
+async function generate_uat_signoff_package(cycleId, clientName, clientTitle, outputFormat = 'docx', outputDir = null, cycleData = null) {
   // Default output directory
   if (!outputDir) {
     outputDir = path.join(os.homedir(), 'Downloads');
@@ -861,8 +884,9 @@ async function generate_uat_signoff_package(cycleId, clientName, clientTitle, ou
   // 4. Query user_stories for story details
   // 5. Query for any defects
 
-  // For now, using mock data to demonstrate structure
-  const data = await getCycleData(cycleId);
+  // Use data supplied by the caller when available; otherwise fall back
+  // to mock data to demonstrate structure
+  const data = cycleData || await getCycleData(cycleId);
 
   // =========================================================================
   // GENERATE DOCUMENT
@@ -870,10 +894,12 @@ async function generate_uat_signoff_package(cycleId, clientName, clientTitle, ou
 
   const doc = generateDocument(cycleId, clientName, clientTitle, data, "Glen Lewis");
 
-  // Generate filename
+  // Generate filename - includes the cycle so packages for several cycles
+  // of one program (batch closeouts) don't overwrite each other
   const timestamp = new Date().toISOString().split('T')[0];
+  const safeCycleId = cycleId.replace(/[^a-zA-Z0-9]/g, '_');
   const safeClientName = clientName.replace(/[^a-zA-Z0-9]/g, '_');
-  const filename = `UAT_SignOff_${data.cycle.program_prefix}_${safeClientName}_${timestamp}.docx`;
+  const filename = `UAT_SignOff_${data.cycle.program_prefix}_${safeCycleId}_${safeClientName}_${timestamp}.docx`;
   const outputPath = path.join(outputDir, filename);
 
   // Write file
@@ -918,8 +944,9 @@ Example:
   }
 
   const [cycleId, clientName, clientTitle, outputDir] = args;
+  const stdinData = readStdinData();
 
-  generate_uat_signoff_package(cycleId, clientName, clientTitle, 'docx', outputDir)
+  generate_uat_signoff_package(cycleId, clientName, clientTitle, 'docx', outputDir, stdinData)
     .then(result => console.log(result))
     .catch(err => {
       console.error('Error generating document:', err);
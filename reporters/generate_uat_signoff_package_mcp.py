@@ -1,91 +1,302 @@
 """
 generate_uat_signoff_package - MCP Tool Integration
 
-Add this to your propel_mcp server.py file.
+Add this to your propel_mcp server.py file, and at server startup point it
+at the database the server writes:
+
+    set_signoff_db_path(DB_PATH)  # the file get_db_connection() opens
+
+Inside this repo (run.py, scripts) the path falls back to
+database.db_manager.get_database_path().
 
 STORY: PLAT-RPT-001 - Generate UAT Sign-Off Package
 """
 
 import os
-import subprocess
+import asyncio
+import atexit
 import json
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import closing
 from datetime import datetime
 from pathlib import Path
+from typing import Optional, Dict, Tuple
 
+# python-docx renders the package in-process (no Node.js startup, no JSON
+# hand-off). Optional - the Node.js generator is used when it's missing.
+try:
+    from docx import Document
+    from docx.enum.table import WD_TABLE_ALIGNMENT
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.oxml import OxmlElement
+    from docx.oxml.ns import qn
+    from docx.shared import Pt, RGBColor, Twips
+    DOCX_AVAILABLE = True
+except ImportError:
+    DOCX_AVAILABLE = False
 
-async def generate_uat_signoff_package(
-    cycle_id: str,
-    client_name: str,
-    client_title: str,
-    output_format: str = "docx",
-    output_dir: str = None
-) -> str:
+# orjson serializes the Node.js payload much faster than stdlib json and
+# returns bytes ready for the subprocess pipe. Optional.
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Which renderer to use: "python" (default, falls back to Node.js when
+# python-docx isn't installed) or "node" to force the Node.js generator.
+SIGNOFF_RENDERER = os.environ.get('UAT_SIGNOFF_RENDERER', 'python')
+
+
+# Anything that isn't an ASCII letter/digit becomes "_" in file names. Same
+# rule as the Node.js generator's /[^a-zA-Z0-9]/g, so both renderers name
+# the output file identically. Compiled once; .sub() scans in C.
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^A-Za-z0-9]')
+
+# One long-lived connection reused across calls, so repeat sign-offs don't
+# pay connect + PRAGMA setup each time and sqlite3's statement cache stays
+# warm. Queries run on asyncio.to_thread workers, so the connection allows
+# cross-thread use and _conn_lock serializes access to it.
+_conn: Optional[sqlite3.Connection] = None
+_conn_lock = threading.Lock()
+
+# Database file set by the host server (see set_signoff_db_path); None
+# means "use this repo's get_database_path()".
+_db_path: Optional[str] = None
+
+
+def set_signoff_db_path(db_path) -> None:
     """
-    Generate a formal UAT Sign-Off Package document for client approval.
+    Point sign-off queries at the host's database file.
 
-    Creates a comprehensive Word document containing:
-    - Cover page with program/cycle information
-    - Executive summary with test statistics and Go/No-Go recommendation
-    - Per-story sign-off sections with linked test case results
-    - Appendix A: Defect log
-    - Appendix B: Compliance matrix (Part11/HIPAA/SOC2 tagged tests)
-    - Final sign-off page with signature blocks
+    Call once at MCP server startup with the same path the server's
+    get_db_connection() opens, so sign-offs read what the server writes.
+    An already-open connection is closed and reopened on the next call.
+
+    Args:
+        db_path: Path to the SQLite database
+    """
+    global _db_path
+    with _conn_lock:
+        _db_path = str(db_path)
+        _close_conn()
+    invalidate_signoff_cache()
+
+
+def _resolve_db_path() -> str:
+    """
+    Return the configured database path, falling back to this repo's
+    get_database_path() (imported here, so the module still loads when
+    pasted into a server without the database package).
+
+    Raises:
+        RuntimeError: No path was set and database.db_manager isn't importable
+    """
+    if _db_path is not None:
+        return _db_path
+    try:
+        from database.db_manager import get_database_path
+    except ImportError:
+        raise RuntimeError(
+            "No sign-off database configured - call set_signoff_db_path() "
+            "with the server's database path at startup"
+        ) from None
+    return str(get_database_path())
+
+
+def _get_conn() -> sqlite3.Connection:
+    """
+    Return the shared read connection, opening and tuning it on first use.
+
+    The database is the one given to set_signoff_db_path() by the host
+    server; inside this repo it defaults to db_manager.get_database_path()
+    (PROPEL_DB_PATH, then the repo's data/ symlink, then the requirements
+    toolkit copy).
+
+    PRAGMAs:
+        journal_mode=WAL   - readers don't block writers (other toolkits)
+        synchronous=NORMAL - safe with WAL, far fewer fsyncs
+        temp_store=MEMORY  - sorts/DISTINCT temp tables stay in RAM
+        cache_size=-65536  - 64 MB page cache
+
+    Read-only: no DDL here. The indexes the sign-off queries use are added
+    by database/migrations/add_signoff_indexes.py (or the MCP server's own
+    schema setup); without them the queries still run, just as scans.
+
+    Returns:
+        sqlite3.Connection with sqlite3.Row row factory
+    """
+    global _conn
+    if _conn is None:
+        _conn = sqlite3.connect(_resolve_db_path(), check_same_thread=False)
+        _conn.row_factory = sqlite3.Row
+        _conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-65536;
+        """)
+    return _conn
+
+
+def _close_conn() -> None:
+    """
+    Close the shared connection (if open) so the next call reopens it.
+
+    Registered with atexit so the file handle is released on shutdown, and
+    called after a database error so a broken handle isn't reused.
+    """
+    global _conn
+    if _conn is not None:
+        _conn.close()
+        _conn = None
+
+
+atexit.register(_close_conn)
+
+
+# Short-lived cache of cycle bundles, keyed by cycle_id. Regenerating a
+# package for the same cycle (new client name, QA re-runs) then skips the
+# database entirely. Entries expire after _BUNDLE_CACHE_TTL seconds; write
+# paths call invalidate_signoff_cache() to drop stale entries immediately.
+# Lookups run on asyncio.to_thread workers (several at once for batches),
+# so every read or write of _bundle_cache holds _cache_lock. The lock is
+# not held while a bundle is queried - that's _conn_lock's job.
+_BUNDLE_CACHE_TTL = 60
+_BUNDLE_CACHE_MAX = 128
+_bundle_cache: Dict[str, Tuple[float, dict]] = {}
+_cache_lock = threading.Lock()
+
+
+def invalidate_signoff_cache(cycle_id: str = None) -> None:
+    """
+    Drop cached sign-off data for a cycle (or every cycle when omitted).
+
+    Call this from the MCP server after any write that changes a cycle's
+    status or results (e.g., update_cycle_status, record_go_nogo_decision).
+
+    Args:
+        cycle_id: Cycle to invalidate; None clears the whole cache
+    """
+    with _cache_lock:
+        if cycle_id is None:
+            _bundle_cache.clear()
+        else:
+            _bundle_cache.pop(cycle_id, None)
+
+
+def _get_cycle_bundle(cycle_id: str) -> Optional[dict]:
+    """
+    Return the cycle bundle from cache if still fresh, else query it.
 
     Args:
         cycle_id: UAT cycle ID (e.g., "UAT-ONB-12345678")
-        client_name: Client/reviewer name for sign-off lines
-        client_title: Client's title (e.g., "Clinical Program Manager")
-        output_format: Output format - "docx" or "pdf" (default: "docx")
-        output_dir: Directory to save file (default: ~/Downloads)
 
     Returns:
-        Path to generated file and summary statistics
+        Same as _load_cycle_bundle()
+    """
+    now = time.monotonic()
+    with _cache_lock:
+        cached = _bundle_cache.get(cycle_id)
+    if cached and now - cached[0] < _BUNDLE_CACHE_TTL:
+        return cached[1]
 
-    Example:
-        generate_uat_signoff_package(
-            cycle_id="UAT-ONB-12345678",
-            client_name="Kim Childers",
-            client_title="Clinical Program Manager"
-        )
+    bundle = _load_cycle_bundle(cycle_id)
+    if bundle is None:
+        return None
+
+    with _cache_lock:
+        # Keep the cache bounded - evict the oldest entry when full
+        if len(_bundle_cache) >= _BUNDLE_CACHE_MAX and cycle_id not in _bundle_cache:
+            oldest = min(_bundle_cache, key=lambda k: _bundle_cache[k][0])
+            del _bundle_cache[oldest]
+
+        _bundle_cache[cycle_id] = (now, bundle)
+    return bundle
+
+
+def _load_cycle_bundle(cycle_id: str) -> Optional[dict]:
     """
+    Query everything the sign-off package needs for one cycle.
 
-    # Default output directory
-    if not output_dir:
-        output_dir = str(Path.home() / "Downloads")
+    Synchronous on purpose - sqlite3 blocks, so async callers run this via
+    asyncio.to_thread(). Holds _conn_lock for the duration of the queries;
+    the cursor is closed on every exit path, and a database error drops
+    the shared connection rather than leaving a bad handle cached.
 
-    # Ensure output directory exists
-    os.makedirs(output_dir, exist_ok=True)
+    Args:
+        cycle_id: UAT cycle ID (e.g., "UAT-ONB-12345678")
 
-    # =========================================================================
-    # QUERY DATABASE FOR CYCLE DATA
-    # =========================================================================
+    Returns:
+        Dict with cycle, stories, test_cases, defects, status_counts and
+        compliance_count, or None if the cycle does not exist
+    """
+    with _conn_lock:
+        try:
+            with closing(_get_conn().cursor()) as cursor:
+                return _query_cycle_bundle(cursor, cycle_id)
+        except sqlite3.Error:
+            _close_conn()
+            raise
 
-    conn = get_db_connection()  # Your existing connection function
-    cursor = conn.cursor()
 
-    # Get cycle info
+def _query_cycle_bundle(cursor: sqlite3.Cursor, cycle_id: str) -> Optional[dict]:
+    """
+    Run the sign-off queries on an already-open cursor.
+
+    Args:
+        cursor: Cursor on a connection with sqlite3.Row row factory
+        cycle_id: UAT cycle ID
+
+    Returns:
+        Same as _load_cycle_bundle()
+    """
+
+    # Get cycle info (program name joined in - falls back to the prefix
+    # when the program row is missing)
     cursor.execute("""
-        SELECT cycle_id, name, program_prefix, uat_type, status,
-               target_launch_date, kickoff_date, testing_start_date,
-               clinical_pm, clinical_pm_email
-        FROM uat_cycles
-        WHERE cycle_id = ?
+        SELECT c.cycle_id, c.name, c.program_prefix, c.uat_type, c.status,
+               c.target_launch_date, c.kickoff_date, c.testing_start_date,
+               c.clinical_pm, c.clinical_pm_email,
+               COALESCE(p.program_name, c.program_prefix) AS program_name
+        FROM uat_cycles c
+        LEFT JOIN programs p ON p.prefix = c.program_prefix
+        WHERE c.cycle_id = ?
     """, (cycle_id,))
 
     cycle_row = cursor.fetchone()
     if not cycle_row:
-        return f"Error: UAT cycle '{cycle_id}' not found"
+        return None
 
     cycle = dict(cycle_row)
 
-    # Get program name
+    # Get summary stats straight from SQLite - one GROUP BY scan instead of
+    # tallying rows in Python. Blank/NULL status counts as 'Not Run', and
+    # blank compliance_framework counts as untagged, matching the row data.
     cursor.execute("""
-        SELECT program_name FROM programs WHERE prefix = ?
-    """, (cycle['program_prefix'],))
-    program_row = cursor.fetchone()
-    cycle['program_name'] = program_row['program_name'] if program_row else cycle['program_prefix']
+        SELECT
+            COALESCE(NULLIF(ua.status, ''), 'Not Run') AS status,
+            COUNT(*) AS test_count,
+            SUM(CASE WHEN tc.compliance_framework IS NOT NULL
+                      AND tc.compliance_framework != '' THEN 1 ELSE 0 END) AS compliance_count
+        FROM uat_assignments ua
+        JOIN test_cases tc ON ua.test_id = tc.test_id
+        WHERE ua.cycle_id = ?
+        GROUP BY 1
+    """, (cycle_id,))
 
-    # Get test assignments with execution results
+    status_counts = Counter()
+    compliance_count = 0
+    for row in cursor.fetchall():
+        status_counts[row['status']] = row['test_count']
+        compliance_count += row['compliance_count']
+
+    # Get test assignments with execution results (still needed row-by-row
+    # for the per-story sections and defect log in the document)
     cursor.execute("""
         SELECT
             ua.test_id,
@@ -107,26 +318,20 @@ async def generate_uat_signoff_package(
         ORDER BY tc.story_id, tc.test_id
     """, (cycle_id,))
 
-    test_assignments = [dict(row) for row in cursor.fetchall()]
-
-    # Get unique story IDs from test assignments
-    story_ids = list(set(ta['story_id'] for ta in test_assignments))
-
-    if story_ids:
-        placeholders = ','.join('?' * len(story_ids))
-        cursor.execute(f"""
-            SELECT story_id, title, user_story, acceptance_criteria, priority, status
-            FROM user_stories
-            WHERE story_id IN ({placeholders})
-            ORDER BY story_id
-        """, story_ids)
-        stories = [dict(row) for row in cursor.fetchall()]
-    else:
-        stories = []
-
-    # Build test cases list with execution data
+    # Build test cases and defects lists in a single pass, reading rows
+    # straight off the cursor - sqlite3.Row supports ta['col'] directly, so
+    # there's no intermediate list of dicts holding the whole result set
+    #
+    # test_cases_by_story maps story_id -> positions in test_cases, so each
+    # story section can pick up its tests with one lookup instead of
+    # re-scanning every test case per story. Positions (not copies) keep
+    # the Node.js payload from carrying every test case twice.
     test_cases = []
-    for ta in test_assignments:
+    defects = []
+    test_cases_by_story = defaultdict(list)
+    for ta in cursor:
+        if ta['story_id'] is not None:
+            test_cases_by_story[ta['story_id']].append(len(test_cases))
         test_cases.append({
             'test_id': ta['test_id'],
             'story_id': ta['story_id'],
@@ -137,9 +342,6 @@ async def generate_uat_signoff_package(
             'execution_notes': ta['execution_notes']
         })
 
-    # Build defects list
-    defects = []
-    for ta in test_assignments:
         if ta['defect_id']:
             defects.append({
                 'defect_id': ta['defect_id'],
@@ -149,7 +351,479 @@ async def generate_uat_signoff_package(
                 'dev_notes': ta['dev_notes']
             })
 
-    conn.close()
+    # Get the stories covered by this cycle's assignments - deduplicated
+    # by the database rather than building an IN (?, ?, ...) list in Python.
+    # Test cases with no story_id drop out of the inner JOIN, so a NULL
+    # story never shows up as an empty sign-off section - and when no
+    # assignment has a story at all there is nothing to look up.
+    stories = []
+    if test_cases_by_story:
+        cursor.execute("""
+            SELECT DISTINCT us.story_id, us.title, us.user_story,
+                   us.acceptance_criteria, us.priority, us.status
+            FROM user_stories us
+            JOIN test_cases tc ON tc.story_id = us.story_id
+            JOIN uat_assignments ua ON ua.test_id = tc.test_id
+            WHERE ua.cycle_id = ?
+            ORDER BY us.story_id
+        """, (cycle_id,))
+        stories = [dict(row) for row in cursor.fetchall()]
+
+    return {
+        'cycle': cycle,
+        'stories': stories,
+        'test_cases': test_cases,
+        'test_cases_by_story': dict(test_cases_by_story),
+        'defects': defects,
+        'status_counts': status_counts,
+        'compliance_count': compliance_count
+    }
+
+
+# ============================================================================
+# PYTHON DOCX RENDERER
+# ============================================================================
+# Port of generate_uat_signoff_package.js. Layout, colors and wording match
+# the Node.js generator so either renderer produces the same document.
+
+SIGNOFF_PREPARED_BY = "Glen Lewis"
+
+# Colors (same palette as the Node.js generator)
+_COLORS = {
+    'PRIMARY': "1B4F72",
+    'SECONDARY': "2E86AB",
+    'HEADER_BG': "D5E8F0",
+    'PASS': "27AE60",
+    'FAIL': "E74C3C",
+    'BLOCKED': "F39C12",
+    'NOT_RUN': "95A5A6",
+}
+
+_STATUS_COLORS = {
+    'Pass': _COLORS['PASS'],
+    'Fail': _COLORS['FAIL'],
+    'Blocked': _COLORS['BLOCKED'],
+    'Skipped': _COLORS['NOT_RUN'],
+    'Not Run': _COLORS['NOT_RUN'],
+}
+
+_RECOMMENDATION_COLORS = {
+    'GO': _COLORS['PASS'],
+    'CONDITIONAL GO': _COLORS['BLOCKED'],
+    'NO-GO': _COLORS['FAIL'],
+}
+
+
+def _add_text(doc, text: str = "", bold: bool = False, italic: bool = False,
+              size: int = None, color: str = None, center: bool = False,
+              space_before: int = None, container=None):
+    """
+    Add a single-run paragraph to the document (or a table cell).
+
+    Args:
+        doc: Document to add to (ignored when container is given)
+        text: Paragraph text
+        bold / italic: Run formatting
+        size: Font size in half-points (docx-js convention, 24 = 12pt)
+        color: Hex color string, e.g. "1B4F72"
+        center: Center-align the paragraph
+        space_before: Spacing before the paragraph, in twips
+        container: Table cell to add the paragraph to instead of doc
+
+    Returns:
+        The new paragraph
+    """
+    target = container if container is not None else doc
+    para = target.add_paragraph()
+    if center:
+        para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    if space_before is not None:
+        para.paragraph_format.space_before = Twips(space_before)
+    if text:
+        run = para.add_run(text)
+        run.bold = bold
+        run.italic = italic
+        if size:
+            run.font.size = Pt(size / 2)
+        if color:
+            run.font.color.rgb = RGBColor.from_string(color)
+    return para
+
+
+def _fill_cell(cell, text: str = "", bold: bool = False, italic: bool = False,
+               color: str = None, shading: str = None):
+    """
+    Replace a table cell's contents with one formatted run.
+
+    Args:
+        cell: python-docx table cell
+        text: Cell text
+        bold / italic: Run formatting
+        color: Hex text color
+        shading: Hex background fill (e.g., header cells)
+    """
+    para = cell.paragraphs[0]
+    run = para.add_run(text)
+    run.bold = bold
+    run.italic = italic
+    if color:
+        run.font.color.rgb = RGBColor.from_string(color)
+    if shading:
+        shd = OxmlElement('w:shd')
+        shd.set(qn('w:val'), 'clear')
+        shd.set(qn('w:color'), 'auto')
+        shd.set(qn('w:fill'), shading)
+        cell._tc.get_or_add_tcPr().append(shd)
+
+
+def _add_table(doc, header: list, rows: list, center: bool = False):
+    """
+    Add a bordered table with an optional shaded header row.
+
+    Args:
+        doc: Document to add to
+        header: Header labels (shaded, bold), or None for no header row
+        rows: List of rows; each cell is a str or a dict of _fill_cell kwargs
+
+    Returns:
+        The new table
+    """
+    ncols = len(header) if header else len(rows[0])
+    table = doc.add_table(rows=0, cols=ncols)
+    table.style = 'Table Grid'
+    if center:
+        table.alignment = WD_TABLE_ALIGNMENT.CENTER
+
+    if header:
+        cells = table.add_row().cells
+        for cell, label in zip(cells, header):
+            _fill_cell(cell, label, bold=True, shading=_COLORS['HEADER_BG'])
+
+    for row in rows:
+        cells = table.add_row().cells
+        for cell, value in zip(cells, row):
+            if isinstance(value, dict):
+                _fill_cell(cell, **value)
+            else:
+                _fill_cell(cell, value)
+    return table
+
+
+def _label(text: str) -> dict:
+    """Shaded, bold label cell for two-column key/value tables."""
+    return {'text': text, 'bold': True, 'shading': _COLORS['HEADER_BG']}
+
+
+def _status_cell(status: str) -> dict:
+    """Colored, bold test-result cell."""
+    status = status or 'Not Run'
+    return {'text': status, 'bold': True,
+            'color': _STATUS_COLORS.get(status, _COLORS['NOT_RUN'])}
+
+
+def _add_signature_block(doc, name: str, title: str = None):
+    """Two-cell signature line (name/title on the left, date on the right)."""
+    table = doc.add_table(rows=1, cols=2)
+    table.alignment = WD_TABLE_ALIGNMENT.CENTER
+    left, right = table.rows[0].cells
+
+    left.paragraphs[0].paragraph_format.space_before = Twips(600)
+    left.paragraphs[0].add_run("_" * 40)
+    _add_text(doc, name, bold=True, container=left)
+    if title:
+        _add_text(doc, title, italic=True, container=left)
+
+    right.paragraphs[0].paragraph_format.space_before = Twips(600)
+    right.paragraphs[0].add_run("_" * 40)
+    _add_text(doc, "Date", bold=True, container=right)
+
+
+def render_signoff_docx(
+    data: dict,
+    output_path: str,
+    client_name: str,
+    client_title: str,
+    stats: dict,
+    prepared_by: str = SIGNOFF_PREPARED_BY
+) -> str:
+    """
+    Render the UAT Sign-Off Package to a .docx file with python-docx.
+
+    Args:
+        data: Dict with cycle, stories, testCases, testCasesByStory, defects
+              (same shape the Node.js generator receives)
+        output_path: Where to write the .docx
+        client_name: Client/reviewer name for sign-off lines
+        client_title: Client's title
+        stats: Dict with total_stories, total_tests, passed, failed, blocked,
+               not_run, pass_rate and recommendation
+        prepared_by: Name shown on the cover page
+
+    Returns:
+        output_path
+    """
+    cycle = data['cycle']
+    stories = data['stories']
+    test_cases = data['testCases']
+    test_cases_by_story = data['testCasesByStory']
+    defects = data['defects']
+
+    doc = Document()
+
+    # Page setup: US Letter, 1" margins, Arial 12pt
+    section = doc.sections[0]
+    section.page_width = Twips(12240)
+    section.page_height = Twips(15840)
+    for side in ('top_margin', 'bottom_margin', 'left_margin', 'right_margin'):
+        setattr(section, side, Twips(1440))
+    normal = doc.styles['Normal']
+    normal.font.name = 'Arial'
+    normal.font.size = Pt(12)
+    for style_name, size, color in (('Heading 1', 16, _COLORS['PRIMARY']),
+                                    ('Heading 2', 13, _COLORS['SECONDARY'])):
+        heading_style = doc.styles[style_name]
+        heading_style.font.name = 'Arial'
+        heading_style.font.size = Pt(size)
+        heading_style.font.bold = True
+        heading_style.font.color.rgb = RGBColor.from_string(color)
+
+    # Header and footer
+    header_para = section.header.paragraphs[0]
+    header_para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
+    header_run = header_para.add_run(f"{cycle['program_name']} - {cycle['name']}")
+    header_run.font.size = Pt(10)
+    header_run.font.color.rgb = RGBColor.from_string(_COLORS['NOT_RUN'])
+
+    footer_para = section.footer.paragraphs[0]
+    footer_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    footer_para.add_run("Page ").font.size = Pt(10)
+    page_field = OxmlElement('w:fldSimple')
+    page_field.set(qn('w:instr'), 'PAGE')
+    footer_para._p.append(page_field)
+    footer_tail = footer_para.add_run(" | Confidential - Propel Health")
+    footer_tail.font.size = Pt(10)
+    footer_tail.font.color.rgb = RGBColor.from_string(_COLORS['NOT_RUN'])
+
+    # --- Cover page ---------------------------------------------------------
+    now = datetime.now()
+    today = f"{now:%B} {now.day}, {now.year}"  # e.g., "January 14, 2025"
+    uat_type = cycle.get('uat_type') or ''
+
+    _add_text(doc, space_before=2400)
+    _add_text(doc, "USER ACCEPTANCE TESTING", bold=True, size=48, color=_COLORS['PRIMARY'], center=True)
+    _add_text(doc, "SIGN-OFF PACKAGE", bold=True, size=40, color=_COLORS['PRIMARY'], center=True,
+              space_before=240)
+    _add_text(doc, space_before=720)
+    _add_text(doc, cycle['program_name'], bold=True, size=36, center=True)
+    _add_text(doc, cycle['name'], italic=True, size=28, center=True, space_before=240)
+    _add_text(doc, space_before=1200)
+    _add_table(doc, None, [
+        [_label("Cycle ID:"), cycle['cycle_id']],
+        [_label("UAT Type:"), uat_type[:1].upper() + uat_type[1:]],
+        [_label("Testing Period:"),
+         f"{cycle.get('kickoff_date') or 'TBD'} - {cycle.get('target_launch_date') or 'TBD'}"],
+        [_label("Document Date:"), today],
+    ], center=True)
+    _add_text(doc, space_before=1200)
+    _add_text(doc, "Prepared For:", bold=True, size=24, center=True)
+    _add_text(doc, client_name, size=24, center=True)
+    _add_text(doc, client_title, italic=True, size=22, center=True)
+    _add_text(doc, space_before=480)
+    _add_text(doc, "Prepared By:", bold=True, size=24, center=True)
+    _add_text(doc, prepared_by, size=24, center=True)
+    _add_text(doc, "Propel Health", italic=True, size=22, center=True)
+    doc.add_page_break()
+
+    # --- Executive summary --------------------------------------------------
+    doc.add_heading("Executive Summary", level=1)
+    _add_text(doc, f"This document summarizes the User Acceptance Testing results for {cycle['name']}. "
+                   "The testing was conducted to validate that the implemented functionality meets the "
+                   "approved requirements and is ready for production deployment.")
+    _add_text(doc, space_before=240)
+    _add_table(doc, None, [
+        [_label("Total User Stories"), str(stats['total_stories'])],
+        [_label("Total Test Cases"), str(stats['total_tests'])],
+        [_label("Passed"), {'text': str(stats['passed']), 'bold': True, 'color': _COLORS['PASS']}],
+        [_label("Failed"), {'text': str(stats['failed']), 'bold': True, 'color': _COLORS['FAIL']}],
+        [_label("Blocked"), {'text': str(stats['blocked']), 'bold': True, 'color': _COLORS['BLOCKED']}],
+        [_label("Not Run"), str(stats['not_run'])],
+        [_label("Pass Rate"), f"{stats['pass_rate']:.1f}%"],
+    ])
+    _add_text(doc, space_before=480)
+    rec_table = doc.add_table(rows=1, cols=1)
+    rec_table.style = 'Table Grid'
+    rec_para = rec_table.rows[0].cells[0].paragraphs[0]
+    rec_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    rec_label = rec_para.add_run("RECOMMENDATION: ")
+    rec_label.bold = True
+    rec_label.font.size = Pt(14)
+    rec_value = rec_para.add_run(stats['recommendation'])
+    rec_value.bold = True
+    rec_value.font.size = Pt(14)
+    rec_value.font.color.rgb = RGBColor.from_string(
+        _RECOMMENDATION_COLORS.get(stats['recommendation'], _COLORS['NOT_RUN'])
+    )
+    doc.add_page_break()
+
+    # --- Story sign-off sections --------------------------------------------
+    doc.add_heading("User Story Acceptance", level=1)
+    _add_text(doc, "Please review each user story and its associated test results. "
+                   "Initial each story to indicate acceptance.")
+    _add_text(doc, space_before=240)
+
+    for story in stories:
+        story_tests = [test_cases[i]
+                       for i in test_cases_by_story.get(story['story_id'], ())]
+
+        doc.add_heading(f"{story['story_id']}: {story['title']}", level=2)
+        _add_table(doc, None, [
+            [_label("Priority:"), story.get('priority') or "Should Have"],
+            [_label("User Story:"), story.get('user_story') or ""],
+            [_label("Acceptance Criteria:"), story.get('acceptance_criteria') or ""],
+        ])
+        _add_text(doc, space_before=240)
+        _add_text(doc, "Test Cases:", bold=True)
+
+        if story_tests:
+            _add_table(doc, ["Test ID", "Title", "Result", "Tester"], [
+                [tc['test_id'], tc.get('title') or "", _status_cell(tc.get('status')),
+                 tc.get('tested_by') or "-"]
+                for tc in story_tests
+            ])
+        else:
+            _add_text(doc, "No test cases linked to this story.", italic=True)
+
+        _add_text(doc, space_before=360)
+        _add_text(doc, "Story Acceptance:", bold=True)
+        _add_table(doc, ["Initial", "Date", "Notes"], [[" ", " ", " "]])
+        _add_text(doc, space_before=480)
+
+    # --- Appendix A: Defect log ---------------------------------------------
+    doc.add_page_break()
+    doc.add_heading("Appendix A: Defect Log", level=1)
+    if defects:
+        _add_table(doc, ["Defect ID", "Test Case", "Description", "Status", "Dev Notes"], [
+            [d.get('defect_id') or "-", d.get('test_id') or "-", d.get('description') or "",
+             d.get('dev_status') or "Open", d.get('dev_notes') or "-"]
+            for d in defects
+        ])
+    else:
+        _add_text(doc, "No defects were recorded during this UAT cycle.", italic=True)
+
+    # --- Appendix B: Compliance matrix --------------------------------------
+    doc.add_page_break()
+    doc.add_heading("Appendix B: Compliance Matrix", level=1)
+    compliance_tests = [tc for tc in test_cases if tc.get('compliance_framework')]
+    if compliance_tests:
+        _add_table(doc, ["Test ID", "Title", "Framework", "Result"], [
+            [tc['test_id'], tc.get('title') or "", tc['compliance_framework'],
+             _status_cell(tc.get('status'))]
+            for tc in compliance_tests
+        ])
+    else:
+        _add_text(doc, "No test cases have compliance framework tags.", italic=True)
+
+    # --- Final sign-off -----------------------------------------------------
+    doc.add_page_break()
+    doc.add_heading("Final UAT Sign-Off", level=1)
+    _add_text(doc, f"By signing below, I acknowledge that I have reviewed the User Acceptance Testing "
+                   f"results for {cycle['name']} and approve the functionality for production deployment.")
+    _add_text(doc, space_before=720)
+    _add_signature_block(doc, client_name, client_title)
+    _add_text(doc, space_before=960)
+    _add_signature_block(doc, "Propel Health Representative")
+
+    doc.save(output_path)
+    return output_path
+
+
+# Indexed by severity: 0 = clean, 1 = gaps in coverage, 2 = failures
+_RECOMMENDATIONS = ('GO', 'CONDITIONAL GO', 'NO-GO')
+
+
+def decide_recommendation(failed: int, blocked: int, not_run: int) -> str:
+    """
+    Map test tallies to a Go/No-Go recommendation.
+
+    Any failure is a NO-GO; blocked or unexecuted tests make it a
+    CONDITIONAL GO; otherwise GO. Kept as a standalone helper so batch
+    reporting sweeps can apply the same rule per cycle.
+
+    Args:
+        failed: Number of failed tests
+        blocked: Number of blocked tests
+        not_run: Number of tests not run or skipped
+
+    Returns:
+        "GO", "CONDITIONAL GO" or "NO-GO"
+    """
+    return _RECOMMENDATIONS[2 if failed else (1 if (blocked or not_run) else 0)]
+
+
+async def generate_uat_signoff_package(
+    cycle_id: str,
+    client_name: str,
+    client_title: str,
+    output_format: str = "docx",
+    output_dir: str = None
+) -> str:
+    """
+    Generate a formal UAT Sign-Off Package document for client approval.
+
+    Creates a comprehensive Word document containing:
+    - Cover page with program/cycle information
+    - Executive summary with test statistics and Go/No-Go recommendation
+    - Per-story sign-off sections with linked test case results
+    - Appendix A: Defect log
+    - Appendix B: Compliance matrix (Part11/HIPAA/SOC2 tagged tests)
+    - Final sign-off page with signature blocks
+
+    Args:
+        cycle_id: UAT cycle ID (e.g., "UAT-ONB-12345678")
+        client_name: Client/reviewer name for sign-off lines
+        client_title: Client's title (e.g., "Clinical Program Manager")
+        output_format: Output format - "docx" or "pdf" (default: "docx")
+        output_dir: Directory to save file (default: ~/Downloads)
+
+    Returns:
+        Path to generated file and summary statistics
+
+    Example:
+        generate_uat_signoff_package(
+            cycle_id="UAT-ONB-12345678",
+            client_name="Kim Childers",
+            client_title="Clinical Program Manager"
+        )
+    """
+
+    # Default output directory
+    if not output_dir:
+        output_dir = str(Path.home() / "Downloads")
+
+    # Ensure output directory exists
+    os.makedirs(output_dir, exist_ok=True)
+
+    # =========================================================================
+    # QUERY DATABASE FOR CYCLE DATA
+    # =========================================================================
+
+    # sqlite3 is blocking, so the queries run on a worker thread to keep the
+    # MCP event loop free for other tool calls
+    bundle = await asyncio.to_thread(_get_cycle_bundle, cycle_id)
+    if bundle is None:
+        return f"Error: UAT cycle '{cycle_id}' not found"
+
+    # Nothing assigned yet - an all-zero sign-off package isn't worth
+    # rendering (or spawning Node for)
+    if not bundle['test_cases']:
+        return f"No test assignments found for UAT cycle '{cycle_id}' - sign-off package not generated"
+
+    cycle = bundle['cycle']
+    stories = bundle['stories']
+    test_cases = bundle['test_cases']
+    defects = bundle['defects']
+    status_counts = bundle['status_counts']
+    compliance_count = bundle['compliance_count']
 
     # =========================================================================
     # PREPARE DATA FOR DOCUMENT GENERATOR
@@ -159,71 +833,111 @@ async def generate_uat_signoff_package(
         'cycle': cycle,
         'stories': stories,
         'testCases': test_cases,
+        'testCasesByStory': bundle['test_cases_by_story'],
         'defects': defects
     }
 
-    # Calculate stats
-    total_tests = len(test_cases)
-    passed = len([tc for tc in test_cases if tc['status'] == 'Pass'])
-    failed = len([tc for tc in test_cases if tc['status'] == 'Fail'])
-    blocked = len([tc for tc in test_cases if tc['status'] == 'Blocked'])
-    not_run = len([tc for tc in test_cases if tc['status'] in ('Not Run', 'Skipped', None)])
+    # Calculate stats from the SQL tallies above
+    total_tests = sum(status_counts.values())
+    passed = status_counts['Pass']
+    failed = status_counts['Fail']
+    blocked = status_counts['Blocked']
+    not_run = status_counts['Not Run'] + status_counts['Skipped']
 
     pass_rate = (passed / (passed + failed + blocked) * 100) if (passed + failed + blocked) > 0 else 0
 
-    # Determine recommendation
-    if failed > 0:
-        recommendation = "NO-GO"
-    elif blocked > 0 or not_run > 0:
-        recommendation = "CONDITIONAL GO"
-    else:
-        recommendation = "GO"
+    recommendation = decide_recommendation(failed, blocked, not_run)
+
+    # Generate filename - includes the cycle so packages for several cycles
+    # of one program (batch closeouts) don't overwrite each other
+    timestamp = datetime.now().strftime('%Y-%m-%d')
+    safe_cycle_id = _UNSAFE_FILENAME_CHARS.sub('_', cycle_id)
+    safe_client_name = _UNSAFE_FILENAME_CHARS.sub('_', client_name)
+    filename = f"UAT_SignOff_{cycle['program_prefix']}_{safe_cycle_id}_{safe_client_name}_{timestamp}.docx"
+    output_path = os.path.join(output_dir, filename)
 
     # =========================================================================
-    # GENERATE DOCUMENT VIA NODE.JS SCRIPT
+    # GENERATE DOCUMENT IN-PROCESS (python-docx)
     # =========================================================================
 
-    # Write data to temp file for Node script
-    temp_data_path = f"/tmp/uat_signoff_data_{cycle_id}.json"
-    with open(temp_data_path, 'w') as f:
-        json.dump(data, f)
+    if SIGNOFF_RENDERER != 'node' and DOCX_AVAILABLE:
+        stats = {
+            'total_stories': len(stories),
+            'total_tests': total_tests,
+            'passed': passed,
+            'failed': failed,
+            'blocked': blocked,
+            'not_run': not_run,
+            'pass_rate': pass_rate,
+            'recommendation': recommendation
+        }
+        # Rendering is CPU/disk work - keep it off the event loop
+        await asyncio.to_thread(
+            render_signoff_docx, data, output_path, client_name, client_title, stats
+        )
+        return _format_summary(
+            cycle, cycle_id, client_name, client_title, stories, total_tests,
+            passed, failed, blocked, not_run, pass_rate, recommendation,
+            defects, compliance_count, output_path
+        )
 
-    # Generate filename
-    timestamp = datetime.now().strftime('%Y-%m-%d')
-    safe_client_name = ''.join(c if c.isalnum() else '_' for c in client_name)
-    filename = f"UAT_SignOff_{cycle['program_prefix']}_{safe_client_name}_{timestamp}.docx"
-    output_path = os.path.join(output_dir, filename)
+    # =========================================================================
+    # GENERATE DOCUMENT VIA NODE.JS SCRIPT (fallback)
+    # =========================================================================
+
+    # Serialize data for the Node script as compact UTF-8 bytes;
+    # default=str covers any value neither encoder handles natively
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(data, default=str)
+    else:
+        payload = json.dumps(data, separators=(',', ':'), default=str).encode('utf-8')
 
     # Call Node.js generator (assumes script is in same directory or in PATH)
-    # You may need to adjust the path to the script
+    # You may need to adjust the path to the script. Data is piped over
+    # stdin, so there is no temp file to write or clean up.
     script_path = os.path.join(os.path.dirname(__file__), 'generate_uat_signoff_package.js')
 
+    # Async subprocess so the event loop keeps serving other MCP calls while
+    # Node renders the document
     try:
-        result = subprocess.run(
-            ['node', script_path, cycle_id, client_name, client_title, output_dir],
-            capture_output=True,
-            text=True,
-            timeout=60
+        proc = await asyncio.create_subprocess_exec(
+            'node', script_path, cycle_id, client_name, client_title, output_dir,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
         )
-
-        if result.returncode != 0:
-            return f"Error generating document: {result.stderr}"
-
-    except subprocess.TimeoutExpired:
-        return "Error: Document generation timed out"
     except FileNotFoundError:
         return "Error: Node.js or generator script not found"
 
-    # Clean up temp file
-    if os.path.exists(temp_data_path):
-        os.remove(temp_data_path)
+    try:
+        _, stderr = await asyncio.wait_for(
+            proc.communicate(input=payload),
+            timeout=60
+        )
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return "Error: Document generation timed out"
+
+    if proc.returncode != 0:
+        return f"Error generating document: {stderr.decode('utf-8', errors='replace')}"
 
     # =========================================================================
     # RETURN SUMMARY
     # =========================================================================
 
-    compliance_count = len([tc for tc in test_cases if tc['compliance_framework']])
+    return _format_summary(
+        cycle, cycle_id, client_name, client_title, stories, total_tests,
+        passed, failed, blocked, not_run, pass_rate, recommendation,
+        defects, compliance_count, output_path
+    )
 
+
+def _format_summary(cycle: dict, cycle_id: str, client_name: str, client_title: str,
+                    stories: list, total_tests: int, passed: int, failed: int,
+                    blocked: int, not_run: int, pass_rate: float, recommendation: str,
+                    defects: list, compliance_count: int, output_path: str) -> str:
+    """Build the text summary returned to the MCP caller."""
     return f"""
 UAT Sign-Off Package Generated
 ==============================
@@ -255,10 +969,74 @@ File: {output_path}
 """
 
 
+async def generate_uat_signoff_packages(
+    cycle_ids: list,
+    client_name: str,
+    client_title: str,
+    output_format: str = "docx",
+    output_dir: str = None,
+    max_workers: int = None
+) -> str:
+    """
+    Generate sign-off packages for several cycles at once (e.g., quarterly
+    closeout), with up to max_workers packages in flight at a time.
+
+    How much that overlaps depends on the renderer. The database phase is
+    always serialized by _conn_lock. With the default in-process
+    python-docx renderer, rendering is GIL-bound work on asyncio.to_thread
+    workers, so packages mostly run one after another - the default of 2
+    just lets one cycle's queries overlap another's render. With the
+    Node.js renderer (UAT_SIGNOFF_RENDERER=node, or python-docx missing)
+    each package renders in its own process, so renders genuinely run in
+    parallel and the default is the CPU count.
+
+    Args:
+        cycle_ids: UAT cycle IDs to generate packages for
+        client_name: Client/reviewer name for sign-off lines
+        client_title: Client's title (e.g., "Clinical Program Manager")
+        output_format: Output format - "docx" or "pdf" (default: "docx")
+        output_dir: Directory to save files (default: ~/Downloads)
+        max_workers: Max packages in flight (default: 2 in-process, CPU
+                     count with the Node.js renderer)
+
+    Returns:
+        Per-cycle summaries, in the same order as cycle_ids (a repeated
+        cycle ID is generated once - both renders would write the same file)
+    """
+    cycle_ids = list(dict.fromkeys(cycle_ids))
+    if not cycle_ids:
+        return "Error: No cycle IDs provided"
+
+    if max_workers:
+        workers = max_workers
+    elif SIGNOFF_RENDERER != 'node' and DOCX_AVAILABLE:
+        workers = 2
+    else:
+        workers = os.cpu_count() or 1
+    limit = asyncio.Semaphore(min(workers, len(cycle_ids)))
+
+    async def _generate_one(cycle_id: str) -> str:
+        async with limit:
+            return await generate_uat_signoff_package(
+                cycle_id=cycle_id,
+                client_name=client_name,
+                client_title=client_title,
+                output_format=output_format,
+                output_dir=output_dir
+            )
+
+    results = await asyncio.gather(*(_generate_one(cid) for cid in cycle_ids))
+    return "\n".join(results)
+
+
 # ============================================================================
 # MCP TOOL REGISTRATION
 # ============================================================================
 
+# At server startup (before the first tool call):
+#
+#     set_signoff_db_path(DB_PATH)  # same file get_db_connection() opens
+#
 # Add this to your tool registration in server.py:
 
 """
@@ -267,6 +1045,10 @@ async def handle_call_tool(name: str, arguments: dict | None) -> list[types.Text
 
     # ... existing tool handlers ...
 
+    elif name in ("update_uat_cycle_status", "record_go_nogo_decision"):
+        # ... existing write handler ...
+        invalidate_signoff_cache(arguments.get("cycle_id"))
+
     elif name == "generate_uat_signoff_package":
         result = await generate_uat_signoff_package(
             cycle_id=arguments.get("cycle_id"),
@@ -21,11 +21,10 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from database.db_manager import UATDatabase, get_database_path
-from database.queries import get_cycle_summary, list_active_cycles, get_gate_checklist
-from importers.nccn_importer import import_nccn_profiles, import_nccn_assignments
-from importers.nccn_notation_parser import parse_test_notation, notation_to_dict, validate_notation
-from reporters.cycle_summary import get_dashboard_report, get_progress_report
-from reporters.excel_export import export_uat_results
+
+# NOTE: importer/reporter modules are imported inside each cmd_* function.
+# A single CLI run only ever executes one command, so there's no reason to
+# pay the import cost (openpyxl, etc.) for the other nine.
 
 
 def cmd_create_cycle(args):
@@ -64,6 +63,9 @@ def cmd_create_cycle(args):
 
 def cmd_status(args):
     """Show cycle status."""
+    from database.queries import list_active_cycles
+    from reporters.cycle_summary import get_dashboard_report
+
     if args.cycle_id:
         print(get_dashboard_report(args.cycle_id))
     else:
@@ -72,6 +74,8 @@ def cmd_status(args):
 
 def cmd_list(args):
     """List UAT cycles."""
+    from reporters.cycle_summary import get_progress_report
+
     print(get_progress_report(
         program_prefix=args.program,
         status_filter=args.status
@@ -107,11 +111,14 @@ def cmd_gate(args):
                 print(f"Error: {message}")
     else:
         # Show gate status
+        from database.queries import get_gate_checklist
         print(get_gate_checklist(args.cycle_id))
 
 
 def cmd_import_nccn(args):
     """Import NCCN profiles from Excel."""
+    from importers.nccn_importer import import_nccn_profiles
+
     result = import_nccn_profiles(
         file_path=args.file,
         cycle_id=args.cycle_id,
@@ -151,6 +158,8 @@ def cmd_import_nccn(args):
 
 def cmd_assign(args):
     """Assign tests from tester sheet."""
+    from importers.nccn_importer import import_nccn_assignments
+
     result = import_nccn_assignments(
         file_path=args.file,
         cycle_id=args.cycle_id,
@@ -178,6 +187,8 @@ def cmd_assign(args):
 
 def cmd_export(args):
     """Export results to Excel."""
+    from reporters.excel_export import export_uat_results
+
     result = export_uat_results(
         cycle_id=args.cycle_id,
         output_dir=args.output_dir
@@ -244,7 +255,9 @@ def cmd_parse_notation(args):
         Like running a preflight checklist parser to verify mission briefing
         is correctly formatted before the mission starts.
     """
-    import json
+    from importers.nccn_notation_parser import (
+        parse_test_notation, notation_to_dict, validate_notation, dumps_pretty
+    )
 
     notation = args.notation
 
@@ -284,7 +297,7 @@ def cmd_parse_notation(args):
 
     # Output based on format
     if args.json:
-        print(json.dumps(result_dict, indent=2))
+        print(dumps_pretty(result_dict))
     else:
         # Human-readable output
         print(f"\nExpected Outcome: {result_dict['expected_outcome'].upper()}")
@@ -327,7 +340,135 @@ def cmd_parse_notation(args):
                 print(f"  ! {err}")
 
 
-def main():
+# ============================================================================
+# ARGUMENT BUILDERS
+# ============================================================================
+# One builder per subcommand. main() only calls the builder for the command
+# actually being run (see COMMANDS below), so a `run.py status ...` call
+# doesn't construct arguments for the nine commands it will never use.
+
+def _add_create_cycle_args(p):
+    p.add_argument('name', help='Cycle name (e.g., "NCCN Q4 2025")')
+    p.add_argument('uat_type', choices=['feature', 'rule_validation', 'regression'],
+                   help='Type of UAT')
+    p.add_argument('--launch-date', dest='launch_date', help='Target launch date (YYYY-MM-DD)')
+    p.add_argument('--program', '-p', help='Program prefix (e.g., PROP)')
+    p.add_argument('--pm', help='Clinical PM name')
+    p.add_argument('--pm-email', help='Clinical PM email')
+    p.add_argument('--description', '-d', help='Cycle description')
+    p.set_defaults(func=cmd_create_cycle)
+
+
+def _add_status_args(p):
+    p.add_argument('cycle_id', nargs='?', help='Cycle ID (or show all active)')
+    p.add_argument('--program', '-p', help='Filter by program prefix')
+    p.set_defaults(func=cmd_status)
+
+
+def _add_list_args(p):
+    p.add_argument('--program', '-p', help='Filter by program prefix')
+    p.add_argument('--status', '-s', help='Filter by status')
+    p.set_defaults(func=cmd_list)
+
+
+def _add_gate_args(p):
+    p.add_argument('cycle_id', help='Cycle ID')
+    p.add_argument('--complete', '-c', help='Mark item ID as complete')
+    p.add_argument('--signoff', help='Sign off on gate (provide signer name)')
+    p.add_argument('--by', help='Who completed the item')
+    p.add_argument('--notes', '-n', help='Notes')
+    p.set_defaults(func=cmd_gate)
+
+
+def _add_import_nccn_args(p):
+    p.add_argument('file', help='Path to Excel file')
+    p.add_argument('cycle_id', help='Cycle ID to associate profiles with')
+    p.add_argument('--sheet', default='Test Profile Catalog', help='Sheet name to import')
+    p.add_argument('--preview', action='store_true', default=True, help='Preview only (default)')
+    p.add_argument('--no-preview', dest='preview', action='store_false', help='Actually import')
+    p.set_defaults(func=cmd_import_nccn)
+
+
+def _add_assign_args(p):
+    p.add_argument('file', help='Path to Excel file')
+    p.add_argument('cycle_id', help='Cycle ID')
+    p.add_argument('--sheet', required=True, help='Tester sheet name (e.g., "Tester 1")')
+    p.add_argument('--tester', required=True, help='Tester email')
+    p.add_argument('--type', default='primary', choices=['primary', 'secondary', 'cross_check'],
+                   help='Assignment type')
+    p.add_argument('--preview', action='store_true', default=True, help='Preview only (default)')
+    p.add_argument('--no-preview', dest='preview', action='store_false', help='Actually assign')
+    p.set_defaults(func=cmd_assign)
+
+
+def _add_export_args(p):
+    p.add_argument('cycle_id', help='Cycle ID to export')
+    p.add_argument('--output-dir', '-o', help='Output directory (default: outputs/)')
+    p.set_defaults(func=cmd_export)
+
+
+def _add_update_status_args(p):
+    p.add_argument('cycle_id', help='Cycle ID')
+    p.add_argument('status', choices=['planning', 'validation', 'kickoff', 'testing',
+                                      'review', 'retesting', 'decision', 'complete', 'cancelled'],
+                   help='New status')
+    p.add_argument('--date', help='Phase date (YYYY-MM-DD, defaults to today)')
+    p.add_argument('--notes', '-n', help='Notes')
+    p.set_defaults(func=cmd_update_status)
+
+
+def _add_decision_args(p):
+    p.add_argument('cycle_id', help='Cycle ID')
+    p.add_argument('decision', choices=['go', 'conditional_go', 'no_go'],
+                   help='Decision')
+    p.add_argument('--signed-by', required=True, help='Who is signing off')
+    p.add_argument('--notes', '-n', help='Decision notes/conditions')
+    p.set_defaults(func=cmd_decision)
+
+
+def _add_parse_notation_args(p):
+    # PURPOSE: Parse NCCN test notation strings for debugging and validation
+    p.add_argument('notation', help='Notation string (e.g., "POS: PHX: Prostate Cancer, Gleason 8")')
+    p.add_argument('--rule', '-r', help='Target NCCN rule ID')
+    p.add_argument('--platform', '-p', choices=['P4M', 'Px4M'], help='Platform (P4M or Px4M)')
+    p.add_argument('--json', '-j', action='store_true', help='Output as JSON')
+    p.add_argument('--validate', '-v', action='store_true', help='Validate notation first')
+    p.set_defaults(func=cmd_parse_notation)
+
+
+# Dispatch table: command name → (help text, argument builder).
+# Order here is the order commands appear in --help.
+COMMANDS = {
+    'create-cycle': ('Create a new UAT cycle', _add_create_cycle_args),
+    'status': ('Show cycle status', _add_status_args),
+    'list': ('List UAT cycles', _add_list_args),
+    'gate': ('View or update pre-UAT gate', _add_gate_args),
+    'import-nccn': ('Import NCCN profiles from Excel', _add_import_nccn_args),
+    'assign': ('Assign tests from tester sheet', _add_assign_args),
+    'export': ('Export results to Excel', _add_export_args),
+    'update-status': ('Update cycle status', _add_update_status_args),
+    'decision': ('Record go/no-go decision', _add_decision_args),
+    'parse-notation': ('Parse NCCN test notation string', _add_parse_notation_args),
+}
+
+
+def build_parser(command: str = None) -> argparse.ArgumentParser:
+    """
+    PURPOSE:
+        Build the CLI argument parser.
+
+    PARAMETERS:
+        command (str): Subcommand being run. Only that subcommand gets its
+                       arguments built. None builds every subcommand.
+
+    RETURNS:
+        argparse.ArgumentParser: Parser ready for parse_args()
+
+    WHY THIS APPROACH:
+        Every subcommand is still registered (so top-level --help lists them
+        all and typos get argparse's normal "invalid choice" error), but the
+        add_argument work only happens for the one being used.
+    """
     parser = argparse.ArgumentParser(
         description='UAT Toolkit - Manage UAT cycles and test execution',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -345,94 +486,18 @@ Examples:
 
     subparsers = parser.add_subparsers(dest='command', help='Command to run')
 
-    # create-cycle command
-    p_create = subparsers.add_parser('create-cycle', help='Create a new UAT cycle')
-    p_create.add_argument('name', help='Cycle name (e.g., "NCCN Q4 2025")')
-    p_create.add_argument('uat_type', choices=['feature', 'rule_validation', 'regression'],
-                          help='Type of UAT')
-    p_create.add_argument('--launch-date', dest='launch_date', help='Target launch date (YYYY-MM-DD)')
-    p_create.add_argument('--program', '-p', help='Program prefix (e.g., PROP)')
-    p_create.add_argument('--pm', help='Clinical PM name')
-    p_create.add_argument('--pm-email', help='Clinical PM email')
-    p_create.add_argument('--description', '-d', help='Cycle description')
-    p_create.set_defaults(func=cmd_create_cycle)
-
-    # status command
-    p_status = subparsers.add_parser('status', help='Show cycle status')
-    p_status.add_argument('cycle_id', nargs='?', help='Cycle ID (or show all active)')
-    p_status.add_argument('--program', '-p', help='Filter by program prefix')
-    p_status.set_defaults(func=cmd_status)
-
-    # list command
-    p_list = subparsers.add_parser('list', help='List UAT cycles')
-    p_list.add_argument('--program', '-p', help='Filter by program prefix')
-    p_list.add_argument('--status', '-s', help='Filter by status')
-    p_list.set_defaults(func=cmd_list)
-
-    # gate command
-    p_gate = subparsers.add_parser('gate', help='View or update pre-UAT gate')
-    p_gate.add_argument('cycle_id', help='Cycle ID')
-    p_gate.add_argument('--complete', '-c', help='Mark item ID as complete')
-    p_gate.add_argument('--signoff', help='Sign off on gate (provide signer name)')
-    p_gate.add_argument('--by', help='Who completed the item')
-    p_gate.add_argument('--notes', '-n', help='Notes')
-    p_gate.set_defaults(func=cmd_gate)
-
-    # import-nccn command
-    p_import = subparsers.add_parser('import-nccn', help='Import NCCN profiles from Excel')
-    p_import.add_argument('file', help='Path to Excel file')
-    p_import.add_argument('cycle_id', help='Cycle ID to associate profiles with')
-    p_import.add_argument('--sheet', default='Test Profile Catalog', help='Sheet name to import')
-    p_import.add_argument('--preview', action='store_true', default=True, help='Preview only (default)')
-    p_import.add_argument('--no-preview', dest='preview', action='store_false', help='Actually import')
-    p_import.set_defaults(func=cmd_import_nccn)
-
-    # assign command
-    p_assign = subparsers.add_parser('assign', help='Assign tests from tester sheet')
-    p_assign.add_argument('file', help='Path to Excel file')
-    p_assign.add_argument('cycle_id', help='Cycle ID')
-    p_assign.add_argument('--sheet', required=True, help='Tester sheet name (e.g., "Tester 1")')
-    p_assign.add_argument('--tester', required=True, help='Tester email')
-    p_assign.add_argument('--type', default='primary', choices=['primary', 'secondary', 'cross_check'],
-                          help='Assignment type')
-    p_assign.add_argument('--preview', action='store_true', default=True, help='Preview only (default)')
-    p_assign.add_argument('--no-preview', dest='preview', action='store_false', help='Actually assign')
-    p_assign.set_defaults(func=cmd_assign)
-
-    # export command
-    p_export = subparsers.add_parser('export', help='Export results to Excel')
-    p_export.add_argument('cycle_id', help='Cycle ID to export')
-    p_export.add_argument('--output-dir', '-o', help='Output directory (default: outputs/)')
-    p_export.set_defaults(func=cmd_export)
-
-    # update-status command
-    p_update = subparsers.add_parser('update-status', help='Update cycle status')
-    p_update.add_argument('cycle_id', help='Cycle ID')
-    p_update.add_argument('status', choices=['planning', 'validation', 'kickoff', 'testing',
-                                              'review', 'retesting', 'decision', 'complete', 'cancelled'],
-                          help='New status')
-    p_update.add_argument('--date', help='Phase date (YYYY-MM-DD, defaults to today)')
-    p_update.add_argument('--notes', '-n', help='Notes')
-    p_update.set_defaults(func=cmd_update_status)
-
-    # decision command
-    p_decision = subparsers.add_parser('decision', help='Record go/no-go decision')
-    p_decision.add_argument('cycle_id', help='Cycle ID')
-    p_decision.add_argument('decision', choices=['go', 'conditional_go', 'no_go'],
-                            help='Decision')
-    p_decision.add_argument('--signed-by', required=True, help='Who is signing off')
-    p_decision.add_argument('--notes', '-n', help='Decision notes/conditions')
-    p_decision.set_defaults(func=cmd_decision)
-
-    # parse-notation command
-    # PURPOSE: Parse NCCN test notation strings for debugging and validation
-    p_parse = subparsers.add_parser('parse-notation', help='Parse NCCN test notation string')
-    p_parse.add_argument('notation', help='Notation string (e.g., "POS: PHX: Prostate Cancer, Gleason 8")')
-    p_parse.add_argument('--rule', '-r', help='Target NCCN rule ID')
-    p_parse.add_argument('--platform', '-p', choices=['P4M', 'Px4M'], help='Platform (P4M or Px4M)')
-    p_parse.add_argument('--json', '-j', action='store_true', help='Output as JSON')
-    p_parse.add_argument('--validate', '-v', action='store_true', help='Validate notation first')
-    p_parse.set_defaults(func=cmd_parse_notation)
+    for name, (help_text, add_args) in COMMANDS.items():
+        sub = subparsers.add_parser(name, help=help_text)
+        if command is None or command == name:
+            add_args(sub)
+
+    return parser
+
+
+def main():
+    # Peek at the subcommand so only its arguments get built
+    command = sys.argv[1] if len(sys.argv) > 1 and sys.argv[1] in COMMANDS else None
+    parser = build_parser(command)
 
     # Parse and execute
     args = parser.parse_args()
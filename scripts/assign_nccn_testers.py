@@ -20,10 +20,11 @@ WHY THIS APPROACH:
     false positives/negatives that a single tester might miss.
 """
 
-import sqlite3
 from datetime import datetime
 from pathlib import Path
 
+from _db import open_db
+
 
 # =====================================================
 # CONFIGURATION
@@ -42,6 +43,30 @@ TESTERS = [
 ]
 
 
+def ensure_assignments_table(cursor) -> None:
+    """
+    PURPOSE:
+        Create uat_test_assignments if the shared database doesn't have it
+        yet (see database/schema.sql).
+
+    WHY THIS APPROACH:
+        uat_test_cases holds one assignee per test, so a cross-check (a
+        second tester on the same test) can't live there without
+        overwriting the primary. The assignments table holds one row per
+        (test, tester, assignment type) instead, which is what
+        generate_tester_trackers.py reads.
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS uat_test_assignments (
+            cycle_id TEXT NOT NULL,
+            test_id TEXT NOT NULL,
+            assigned_to TEXT NOT NULL,
+            assignment_type TEXT NOT NULL,
+            PRIMARY KEY (cycle_id, test_id, assigned_to, assignment_type)
+        )
+    """)
+
+
 def main():
     """
     PURPOSE:
@@ -51,7 +76,7 @@ def main():
         1. Get all test cases for the cycle
         2. Divide evenly among testers (primary assignment)
         3. Add cross-check assignments (10 tests from next tester)
-        4. Update the database
+        4. Update the database (one transaction, one NTILE UPDATE)
     """
     print(f"Assigning testers for: {CYCLE_ID}")
 
@@ -60,117 +85,158 @@ def main():
         print(f"Error: Database not found: {DB_PATH}")
         return
 
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-
-    # Check if cycle exists
-    cursor.execute("SELECT name FROM uat_cycles WHERE cycle_id = ?", (CYCLE_ID,))
-    row = cursor.fetchone()
-    if not row:
-        print(f"Error: Cycle not found: {CYCLE_ID}")
-        print("Create the cycle first.")
-        conn.close()
-        return
-
-    print(f"   Cycle: {row[0]}")
-
-    # Get all test cases for this cycle (unassigned or to reassign)
-    cursor.execute("""
-        SELECT test_id, profile_id
-        FROM uat_test_cases
-        WHERE uat_cycle_id = ?
-        ORDER BY test_id
-    """, (CYCLE_ID,))
-
-    tests = cursor.fetchall()
-
-    if not tests:
-        print(f"Error: No tests found for cycle {CYCLE_ID}")
-        print("Import test cases first.")
-        conn.close()
-        return
-
-    print(f"   Found {len(tests)} tests")
-
-    # Calculate distribution
-    # Goal: Each tester gets ~equal primary tests + some cross-checks
-    num_testers = len(TESTERS)
-    tests_per_tester = len(tests) // num_testers
-    remainder = len(tests) % num_testers
-    cross_check_count = min(10, tests_per_tester // 4)  # ~25% as cross-check
-
-    print(f"   {tests_per_tester} tests per tester (primary)")
-    print(f"   {cross_check_count} tests per tester (cross-check)")
-
-    # Clear existing assignments for this cycle
-    cursor.execute("""
-        UPDATE uat_test_cases
-        SET assigned_to = NULL, assignment_type = NULL
-        WHERE uat_cycle_id = ?
-    """, (CYCLE_ID,))
-    print(f"   Cleared existing assignments")
-
-    # Assign primary tests
-    start_idx = 0
-    for i, tester in enumerate(TESTERS):
+    # isolation_level=None = autocommit mode, so the assignment phase below
+    # controls its own transaction explicitly (BEGIN IMMEDIATE ... COMMIT).
+    # open_db applies the shared PRAGMAs (WAL, temp_store=MEMORY, ...) and
+    # closes the connection however the block exits.
+    with open_db(DB_PATH, isolation_level=None) as conn:
+        cursor = conn.cursor()
+
+        # Check if cycle exists
+        cursor.execute("SELECT name FROM uat_cycles WHERE cycle_id = ?", (CYCLE_ID,))
+        row = cursor.fetchone()
+        if not row:
+            print(f"Error: Cycle not found: {CYCLE_ID}")
+            print("Create the cycle first.")
+            return
+
+        print(f"   Cycle: {row[0]}")
+
+        # Count test cases for this cycle (unassigned or to reassign) - the
+        # distribution only needs the total; the IDs are streamed later
+        cursor.execute("""
+            SELECT COUNT(*)
+            FROM uat_test_cases
+            WHERE uat_cycle_id = ?
+        """, (CYCLE_ID,))
+
+        total_tests = cursor.fetchone()[0]
+
+        if not total_tests:
+            print(f"Error: No tests found for cycle {CYCLE_ID}")
+            print("Import test cases first.")
+            return
+
+        print(f"   Found {total_tests} tests")
+
+        # Calculate distribution
+        # Goal: Each tester gets ~equal primary tests + some cross-checks
+        num_testers = len(TESTERS)
+        tests_per_tester = total_tests // num_testers
+        remainder = total_tests % num_testers
+        cross_check_count = min(10, tests_per_tester // 4)  # ~25% as cross-check
+
+        print(f"   {tests_per_tester} tests per tester (primary)")
+        print(f"   {cross_check_count} tests per tester (cross-check)")
+
+        # Everything from the assignment to the audit entry is one write
+        # transaction: one commit (and one fsync) instead of one per test,
+        # and a failure part-way leaves the previous assignments intact.
+        # IMMEDIATE takes the write lock up front so another writer can't
+        # change the cycle's tests between the statements below.
+        cursor.execute("BEGIN IMMEDIATE")
+
+        # Primary tests per tester
         # Give extra tests to early testers if there's a remainder
-        count = tests_per_tester + (1 if i < remainder else 0)
-        end_idx = start_idx + count
-
-        primary_tests = tests[start_idx:end_idx]
-
-        for test_id, profile_id in primary_tests:
-            cursor.execute("""
-                UPDATE uat_test_cases
-                SET assigned_to = ?, assignment_type = 'primary'
-                WHERE test_id = ?
-            """, (tester['email'], test_id))
-
-        print(f"   {tester['name']}: {len(primary_tests)} primary")
-        start_idx = end_idx
-
-    # Assign cross-check tests
-    # Each tester gets some tests from the next tester's batch for validation
-    start_idx = 0
-    for i, tester in enumerate(TESTERS):
-        # Get tests from the NEXT tester's primary batch
-        next_idx = (i + 1) % num_testers
-        next_start = sum(tests_per_tester + (1 if j < remainder else 0)
-                        for j in range(next_idx))
-
-        # Take first N tests from next tester's batch for cross-check
-        cross_tests = tests[next_start:next_start + cross_check_count]
-
-        for test_id, profile_id in cross_tests:
-            # Note: This creates a second assignment, but since we're
-            # storing in the same row, we need a different approach.
-            # For now, we'll skip cross-check to avoid overwriting primary.
-            pass
-
-        # For a proper cross-check, you'd need a separate assignments table
-        # or a JSON field to store multiple assignees per test.
-        # For now, we'll just note it in the output.
-        print(f"   {tester['name']}: (cross-check ready, needs separate table)")
-
-    # Log to audit history
-    cursor.execute("""
-        INSERT INTO audit_history (
-            record_type, record_id, action, field_changed,
-            old_value, new_value, changed_by, change_reason
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
-        'uat_test_cases',
-        CYCLE_ID,
-        'ASSIGN',
-        'assigned_to',
-        None,
-        f"Assigned {len(tests)} tests to {num_testers} testers",
-        'system',
-        f"Bulk assignment via assign_nccn_testers.py"
-    ))
-
-    conn.commit()
-    conn.close()
+        # (the same split NTILE makes below - this is just for the report)
+        for i, tester in enumerate(TESTERS):
+            count = tests_per_tester + (1 if i < remainder else 0)
+            print(f"   {tester['name']}: {count} primary")
+
+        # Partition in SQL: NTILE(n) numbers the cycle's tests 1..n in
+        # test_id order (earlier buckets take the remainder, same as above),
+        # pos is each test's place within its bucket, and the VALUES list
+        # maps bucket -> tester email. Shared by both statements below.
+        params = {
+            'cycle_id': CYCLE_ID,
+            'num_testers': num_testers,
+            'cross_check_count': cross_check_count
+        }
+        tester_values = []
+        for bucket, tester in enumerate(TESTERS, start=1):
+            tester_values.append(f"(:bucket{bucket}, :email{bucket})")
+            params[f'bucket{bucket}'] = bucket
+            params[f'email{bucket}'] = tester['email']
+
+        bucket_ctes = f"""
+            WITH buckets AS (
+                SELECT test_id,
+                       NTILE(:num_testers) OVER (ORDER BY test_id) AS bucket
+                FROM uat_test_cases
+                WHERE uat_cycle_id = :cycle_id
+            ),
+            ranked AS (
+                SELECT test_id, bucket,
+                       ROW_NUMBER() OVER (PARTITION BY bucket ORDER BY test_id) AS pos
+                FROM buckets
+            ),
+            testers(bucket, email) AS (VALUES {", ".join(tester_values)})
+        """
+
+        # Primary assignee on the test case itself, for all tests in one
+        # UPDATE ... FROM (SQLite 3.33+). Every test in the cycle lands in
+        # a bucket, so this overwrites any previous assignment directly -
+        # no clear-to-NULL pass first - and rows that already hold the
+        # right assignee aren't rewritten at all.
+        cursor.execute(bucket_ctes + """
+            UPDATE uat_test_cases
+            SET assigned_to = t.email, assignment_type = 'primary'
+            FROM ranked r
+            JOIN testers t ON t.bucket = r.bucket
+            WHERE uat_test_cases.test_id = r.test_id
+              AND (uat_test_cases.assigned_to IS NOT t.email
+                   OR uat_test_cases.assignment_type IS NOT 'primary')
+        """, params)
+
+        # Assign cross-check tests
+        # Each tester gets some tests from the next tester's batch for
+        # validation (the first cross_check_count tests of that batch).
+        # A second assignee can't share the test case row, so primary and
+        # cross-check assignments both go to uat_test_assignments - in one
+        # INSERT. Bucket b is cross-checked by the tester before it
+        # (bucket 1 by the last tester).
+        ensure_assignments_table(cursor)
+        cursor.execute(
+            "DELETE FROM uat_test_assignments WHERE cycle_id = ?", (CYCLE_ID,)
+        )
+        cursor.execute(bucket_ctes + """
+            INSERT INTO uat_test_assignments (
+                cycle_id, test_id, assigned_to, assignment_type
+            )
+            SELECT :cycle_id, r.test_id, t.email, 'primary'
+            FROM ranked r
+            JOIN testers t ON t.bucket = r.bucket
+            UNION ALL
+            SELECT :cycle_id, r.test_id, t.email, 'cross_check'
+            FROM ranked r
+            JOIN testers t
+              ON t.bucket = (r.bucket + :num_testers - 2) % :num_testers + 1
+            WHERE r.pos <= :cross_check_count
+        """, params)
+
+        for i, tester in enumerate(TESTERS):
+            next_tester = TESTERS[(i + 1) % num_testers]
+            print(f"   {tester['name']}: {cross_check_count} cross-check "
+                  f"(from {next_tester['name']})")
+
+        # Log to audit history
+        cursor.execute("""
+            INSERT INTO audit_history (
+                record_type, record_id, action, field_changed,
+                old_value, new_value, changed_by, change_reason
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            'uat_test_cases',
+            CYCLE_ID,
+            'ASSIGN',
+            'assigned_to',
+            None,
+            f"Assigned {total_tests} tests to {num_testers} testers",
+            'system',
+            f"Bulk assignment via assign_nccn_testers.py"
+        ))
+
+        conn.commit()
 
     print(f"\nAssignments complete!")
     print(f"\nNext steps:")
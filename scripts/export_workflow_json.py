@@ -18,8 +18,79 @@ WHY THIS APPROACH:
 
 import sqlite3
 import json
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime
+from textwrap import indent
+
+from _db import open_db
+
+# orjson is optional - a Rust JSON encoder that is much faster than the
+# stdlib encoder when indenting. Falls back to stdlib json if not installed.
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Column order of each exported test (after the leading workflow_section
+# column in get_all_onb_tests)
+TEST_FIELDS = (
+    "test_id",
+    "title",
+    "workflow_order",
+    "original_category",
+    "test_type",
+    "test_steps",
+    "expected_results",
+    "prerequisites",
+    "priority",
+    "test_status"
+)
+
+
+def dumps_indented(data: dict) -> str:
+    """
+    PURPOSE:
+        Serialize one export section as 2-space indented JSON.
+
+    PARAMETERS:
+        data (dict): Section dict (metadata plus its tests)
+
+    RETURNS:
+        str: Indented JSON text, non-ASCII characters kept as-is
+
+    WHY THIS APPROACH:
+        The stdlib encoder drops to pure Python whenever indent is set, so
+        it dominates large exports. orjson indents in compiled code and
+        always emits UTF-8 (same as ensure_ascii=False); stdlib json is the
+        fallback so nothing breaks when orjson isn't installed.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def ensure_workflow_index(conn: sqlite3.Connection) -> None:
+    """
+    PURPOSE:
+        Create the partial index on ONB tests by (workflow_section,
+        workflow_order) if the shared database doesn't have it yet
+        (see database/schema.sql).
+
+    WHY THIS APPROACH:
+        The partial index only holds ONB tests, so the export reads just
+        those rows, already in walkthrough order within each section.
+        Its WHERE matches the export query's LIKE exactly - SQLite only
+        uses a partial index when the query repeats its condition.
+    """
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_tc_workflow
+            ON uat_test_cases(workflow_section, workflow_order)
+            WHERE test_id LIKE 'ONB-%'
+    """)
 
 
 def get_workflow_sections(conn: sqlite3.Connection) -> list:
@@ -50,52 +121,43 @@ def get_workflow_sections(conn: sqlite3.Connection) -> list:
     return sections
 
 
-def get_tests_for_section(conn: sqlite3.Connection, section_code: str) -> list:
+def get_all_onb_tests(conn: sqlite3.Connection) -> sqlite3.Cursor:
     """
     PURPOSE:
-        Retrieve all test cases for a specific workflow section.
-
-    PARAMETERS:
-        section_code (str): The workflow section code (e.g., 'P4M', 'GRX')
+        Retrieve every ONB test case in workflow order, in one query.
 
     RETURNS:
-        list: List of test case dicts ordered by workflow_order
+        sqlite3.Cursor: Iterates row tuples of (workflow_section, *TEST_FIELDS),
+                        ordered by section display_order then workflow_order.
+                        Tests outside a defined workflow section are skipped.
+
+    WHY THIS APPROACH:
+        One SELECT instead of one per section, returned as a live cursor so
+        rows are pulled as they're written out. The caller groups them by
+        section with itertools.groupby, which works because the rows
+        arrive already sorted by section.
     """
     cursor = conn.cursor()
     cursor.execute("""
         SELECT
-            test_id,
-            title,
-            workflow_order,
-            category as original_category,
-            test_type,
-            test_steps,
-            expected_results,
-            prerequisites,
-            priority,
-            test_status
-        FROM uat_test_cases
-        WHERE test_id LIKE 'ONB-%'
-          AND workflow_section = ?
-        ORDER BY workflow_order
-    """, (section_code,))
-
-    tests = []
-    for row in cursor.fetchall():
-        tests.append({
-            "test_id": row[0],
-            "title": row[1],
-            "workflow_order": row[2],
-            "original_category": row[3],
-            "test_type": row[4],
-            "test_steps": row[5],
-            "expected_results": row[6],
-            "prerequisites": row[7],
-            "priority": row[8],
-            "test_status": row[9]
-        })
+            tc.workflow_section,
+            tc.test_id,
+            tc.title,
+            tc.workflow_order,
+            tc.category as original_category,
+            tc.test_type,
+            tc.test_steps,
+            tc.expected_results,
+            tc.prerequisites,
+            tc.priority,
+            tc.test_status
+        FROM uat_test_cases tc
+        JOIN uat_workflow_sections ws ON ws.section_code = tc.workflow_section
+        WHERE tc.test_id LIKE 'ONB-%'
+        ORDER BY ws.display_order, ws.section_code, tc.workflow_order
+    """)
 
-    return tests
+    return cursor
 
 
 def export_workflow_json(db_path: str, output_path: str) -> dict:
@@ -116,51 +178,51 @@ def export_workflow_json(db_path: str, output_path: str) -> dict:
         across technical categories.
     """
     # Connect to database
-    conn = sqlite3.connect(db_path)
-
-    # Build the export structure
-    export_data = {
-        "cycle_name": "ONB Questionnaire v1",
-        "structure": "workflow",
-        "exported_date": datetime.now().isoformat(),
-        "sections": []
-    }
-
-    # Get workflow sections and their tests
-    sections = get_workflow_sections(conn)
-
-    # Track statistics for summary
-    stats = {}
-
-    for section in sections:
-        tests = get_tests_for_section(conn, section["code"])
-
-        # Only include sections that have tests
-        if tests:
-            section_data = {
-                "code": section["code"],
-                "name": section["name"],
-                "description": section["description"],
-                "guidance": section["guidance"],
-                "test_count": len(tests),
-                "tests": tests
-            }
-            export_data["sections"].append(section_data)
-            stats[section["code"]] = len(tests)
-
-    # Calculate totals
-    export_data["total_tests"] = sum(stats.values())
-
-    # Write to file with nice formatting
-    # indent=2 for readability, ensure_ascii=False to preserve special chars
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(export_data, f, indent=2, ensure_ascii=False)
-
-    conn.close()
+    with open_db(db_path) as conn:
+        ensure_workflow_index(conn)
+
+        # Section metadata is small - look it up by code as tests stream in
+        sections = {section["code"]: section for section in get_workflow_sections(conn)}
+
+        # Track statistics for summary
+        stats = {}
+
+        # Stream the export: the file is written section by section as rows
+        # come off the cursor, so only one section's tests are ever held in
+        # memory. The layout matches json.dump(..., indent=2) - each section
+        # is dumped with indent=2 and shifted to its nesting depth.
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write("{\n")
+            f.write('  "cycle_name": "ONB Questionnaire v1",\n')
+            f.write('  "structure": "workflow",\n')
+            f.write(f'  "exported_date": "{datetime.now().isoformat()}",\n')
+            f.write('  "sections": [')
+
+            # Only sections that have tests appear (groupby yields no empty groups)
+            for code, rows in groupby(get_all_onb_tests(conn), key=itemgetter(0)):
+                section = sections[code]
+                tests = [dict(zip(TEST_FIELDS, row[1:])) for row in rows]
+                section_data = {
+                    "code": section["code"],
+                    "name": section["name"],
+                    "description": section["description"],
+                    "guidance": section["guidance"],
+                    "test_count": len(tests),
+                    "tests": tests
+                }
+
+                f.write(",\n" if stats else "\n")
+                f.write(indent(dumps_indented(section_data), "    "))
+                stats[code] = len(tests)
+
+            f.write("\n  ]" if stats else "]")
+
+            # Calculate totals (written last, same position as before)
+            f.write(f',\n  "total_tests": {sum(stats.values())}\n}}')
 
     return {
         "output_file": output_path,
-        "total_tests": export_data["total_tests"],
+        "total_tests": sum(stats.values()),
         "sections": stats
     }
 
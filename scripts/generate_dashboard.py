@@ -10,6 +10,7 @@ R EQUIVALENT:
 
 USAGE:
     python scripts/generate_dashboard.py UAT-NCCN-Q4-2025
+    python scripts/generate_dashboard.py UAT-NCCN-Q4-2025 --force
 
 WHY THIS APPROACH:
     Progress syncs from testers come via Formspree (or manual export).
@@ -18,12 +19,19 @@ WHY THIS APPROACH:
     breakdowns. The dashboard is regenerated as new results are imported.
 """
 
+import hashlib
 import json
+import shutil
 import sqlite3
+import subprocess
 import sys
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 
+from _db import open_db
+
 
 # =====================================================
 # CONFIGURATION
@@ -34,6 +42,63 @@ REPO_ROOT = Path(__file__).parent.parent
 DB_PATH = REPO_ROOT / "data" / "client_product_database.db"
 OUTPUT_DIR = REPO_ROOT / "docs"
 
+# esbuild (optional) precompiles the dashboard's JSX to plain JS at
+# generation time, so viewers don't download Babel (~3 MB) and compile
+# in the browser on every page load. Without it, Babel runs in-browser.
+ESBUILD = shutil.which("esbuild")
+
+# Data signatures of the last generated dashboards, one file per cycle.
+# Kept outside docs/ so they're never published with the site.
+CACHE_DIR = REPO_ROOT / ".dashboard-cache"
+
+# One <tr> of the tester progress table, filled with str.format_map().
+# Parsed once here rather than as an f-string rebuilt per tester.
+# {{{{ }}}} renders as JSX's style={{ }} double braces.
+TESTER_ROW_TEMPLATE = """
+            <tr className="{row_class}">
+              <td className="px-4 py-3 whitespace-nowrap">
+                <div className="font-medium text-gray-900">{name}</div>
+                <div className="text-xs text-gray-500">{email}</div>
+              </td>
+              <td className="px-4 py-3 text-center">
+                <div className="flex items-center justify-center gap-1">
+                  <div className="w-16 h-2 bg-gray-200 rounded-full overflow-hidden">
+                    <div className="bg-blue-500 h-full" style={{{{ width: '{percent_complete}%' }}}} />
+                  </div>
+                  <span className="text-sm font-medium">{percent_complete}%</span>
+                </div>
+              </td>
+              <td className="px-4 py-3 text-center text-green-600 font-medium">{passed}</td>
+              <td className="px-4 py-3 text-center text-red-600 font-medium">{failed}</td>
+              <td className="px-4 py-3 text-center text-amber-600">{blocked}</td>
+              <td className="px-4 py-3 text-center text-gray-400">{not_run}</td>
+              <td className="px-4 py-3 text-center text-xs text-gray-500">
+                {last_tested_day}
+              </td>
+            </tr>"""
+
+
+def ensure_dashboard_index(cursor) -> None:
+    """
+    PURPOSE:
+        Create the covering index the progress query reads from, if the
+        shared database doesn't have it yet (see database/schema.sql).
+
+    PARAMETERS:
+        cursor: SQLite cursor
+
+    WHY THIS APPROACH:
+        With every column the aggregation touches in one index, SQLite
+        answers it from a range scan of the cycle's index entries instead
+        of scanning the whole table. IF NOT EXISTS makes it a no-op after
+        the first run.
+    """
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_tc_cycle_assignee_status
+            ON uat_test_cases(uat_cycle_id, assigned_to, test_status, tested_date)
+            WHERE uat_cycle_id IS NOT NULL
+    """)
+
 
 def get_cycle_info(cursor, cycle_id: str) -> dict:
     """
@@ -41,7 +106,7 @@ def get_cycle_info(cursor, cycle_id: str) -> dict:
         Get cycle metadata from the database.
 
     PARAMETERS:
-        cursor: SQLite cursor
+        cursor: SQLite cursor (sqlite3.Row row factory)
         cycle_id (str): The cycle identifier (e.g., "UAT-NCCN-Q4-2025")
 
     RETURNS:
@@ -55,112 +120,179 @@ def get_cycle_info(cursor, cycle_id: str) -> dict:
 
     row = cursor.fetchone()
     if row:
-        return {
-            'cycle_id': row[0],
-            'name': row[1],
-            'target_date': row[2],
-            'status': row[3]
-        }
+        return dict(row)
     return None
 
 
-def get_tester_progress(cursor, cycle_id: str) -> list:
+# Status count columns of the progress query, in summarize_counts() order
+COUNT_COLUMNS = ('total', 'passed', 'failed', 'blocked', 'skipped')
+get_counts = itemgetter(*COUNT_COLUMNS)
+
+
+@lru_cache(maxsize=256)
+def tester_display_name(email: str) -> str:
+    """
+    PURPOSE:
+        Derive a display name from a tester email
+        (e.g. "kim.childers@providence.org" -> "Kim Childers").
+
+    WHY THIS APPROACH:
+        Cached because the same handful of testers recur across cycles
+        and dashboard runs in one process.
+    """
+    return email.split('@')[0].replace('.', ' ').title()
+
+
+def get_data_signature(cycle_info: dict, overall: dict, testers: list) -> bytes:
     """
     PURPOSE:
-        Get progress summary for each tester in the cycle.
+        Fingerprint everything the dashboard is generated from - the data
+        it displays and the generator itself - so a rerun can tell whether
+        anything changed since the last generation.
 
     PARAMETERS:
-        cursor: SQLite cursor
+        cycle_info (dict): Cycle metadata
+        overall (dict): Overall statistics
+        testers (list): Per-tester statistics
+
+    RETURNS:
+        bytes: 16-byte blake2b digest
+
+    WHY THIS APPROACH:
+        The progress query is an index-only range scan (see
+        ensure_dashboard_index), so it's as cheap as any "what changed?"
+        probe - and hashing its results is exact: a reassignment or status
+        edit that leaves counts and dates alone still changes the digest.
+        What a match saves is rebuilding and rewriting the HTML.
+        The page templates live in this script, and whether esbuild is
+        installed changes the emitted script, so both are hashed too -
+        editing the generator or adding/removing esbuild regenerates the
+        page without needing --force.
+    """
+    fingerprint = json.dumps([cycle_info, overall, testers, bool(ESBUILD)], default=str)
+    digest = hashlib.blake2b(fingerprint.encode('utf-8'), digest_size=16)
+    digest.update(Path(__file__).read_bytes())
+    return digest.digest()
+
+
+def summarize_counts(total: int, passed: int, failed: int, blocked: int, skipped: int) -> dict:
+    """
+    PURPOSE:
+        Turn raw status counts into the stats dict the dashboard displays.
+
+    PARAMETERS:
+        total (int): Number of tests
+        passed, failed, blocked, skipped (int): Tests in each status
+
+    RETURNS:
+        dict: Counts plus not_run, executed and percent_complete
+    """
+    executed = passed + failed + blocked + skipped
+    pct = round((executed / total) * 100) if total > 0 else 0
+
+    return {
+        'total': total,
+        'passed': passed,
+        'failed': failed,
+        'blocked': blocked,
+        'skipped': skipped,
+        'not_run': total - executed,
+        'executed': executed,
+        'percent_complete': pct
+    }
+
+
+def get_cycle_progress(cursor, cycle_id: str) -> tuple:
+    """
+    PURPOSE:
+        Get overall cycle statistics and the progress summary for each
+        tester, from a single pass over the cycle's test cases.
+
+    PARAMETERS:
+        cursor: SQLite cursor (sqlite3.Row row factory)
         cycle_id (str): The cycle identifier
 
     RETURNS:
-        list: List of dicts with tester progress stats
+        tuple: (overall dict, list of per-tester dicts)
 
     WHY THIS APPROACH:
         We group by assigned_to to get per-tester statistics,
-        similar to dplyr::group_by() + summarise() in R.
+        similar to dplyr::group_by() + summarise() in R. The overall
+        numbers are just the column sums of those groups (including the
+        unassigned group), so there's no need for a second scan of the
+        same rows. Status counts use aggregate FILTER clauses
+        (SQLite 3.30+) rather than SUM(CASE WHEN ...).
     """
     cursor.execute("""
         SELECT
             assigned_to,
             COUNT(*) as total,
-            SUM(CASE WHEN test_status = 'Pass' THEN 1 ELSE 0 END) as passed,
-            SUM(CASE WHEN test_status = 'Fail' THEN 1 ELSE 0 END) as failed,
-            SUM(CASE WHEN test_status = 'Blocked' THEN 1 ELSE 0 END) as blocked,
-            SUM(CASE WHEN test_status = 'Skipped' THEN 1 ELSE 0 END) as skipped,
-            SUM(CASE WHEN test_status NOT IN ('Not Run', '') OR test_status IS NULL THEN 0 ELSE 1 END) as not_run,
+            COUNT(*) FILTER (WHERE test_status = 'Pass') as passed,
+            COUNT(*) FILTER (WHERE test_status = 'Fail') as failed,
+            COUNT(*) FILTER (WHERE test_status = 'Blocked') as blocked,
+            COUNT(*) FILTER (WHERE test_status = 'Skipped') as skipped,
             MAX(tested_date) as last_tested
         FROM uat_test_cases
         WHERE uat_cycle_id = ?
-        AND assigned_to IS NOT NULL
         GROUP BY assigned_to
         ORDER BY assigned_to
     """, (cycle_id,))
+    rows = cursor.fetchall()
+    counts = [get_counts(row) for row in rows]
+
+    # Overall = column-wise sum of every group's counts
+    # (zip(*[]) is empty, so a cycle with no tests falls back to zeros)
+    column_totals = [sum(column) for column in zip(*counts)]
+    overall = summarize_counts(*(column_totals or [0] * len(COUNT_COLUMNS)))
 
     testers = []
-    for row in cursor.fetchall():
-        total = row[1]
-        executed = row[2] + row[3] + row[4] + row[5]  # pass + fail + blocked + skipped
-        pct = round((executed / total) * 100) if total > 0 else 0
-
-        testers.append({
-            'email': row[0],
-            'name': row[0].split('@')[0].replace('.', ' ').title() if row[0] else 'Unassigned',
-            'total': total,
-            'passed': row[2],
-            'failed': row[3],
-            'blocked': row[4],
-            'skipped': row[5],
-            'not_run': total - executed,
-            'executed': executed,
-            'percent_complete': pct,
-            'last_tested': row[7]
-        })
-
-    return testers
-
-
-def get_overall_stats(cursor, cycle_id: str) -> dict:
+    for row, row_counts in zip(rows, counts):
+        email = row['assigned_to']
+        # Unassigned tests count toward overall but aren't a tester
+        if email is None:
+            continue
+
+        tester = {'email': email, 'name': tester_display_name(email)}
+        tester.update(summarize_counts(*row_counts))
+        tester['last_tested'] = row['last_tested']
+        testers.append(tester)
+
+    return overall, testers
+
+
+def compile_jsx(jsx: str):
     """
     PURPOSE:
-        Get overall cycle statistics.
+        Compile the dashboard's JSX to plain JavaScript with esbuild.
 
     PARAMETERS:
-        cursor: SQLite cursor
-        cycle_id (str): The cycle identifier
+        jsx (str): JSX source (the body of the dashboard <script>)
 
     RETURNS:
-        dict: Overall cycle statistics
+        str: Minified JS (React.createElement calls), or None if esbuild
+             isn't installed or fails - the caller then falls back to
+             in-browser Babel
     """
-    cursor.execute("""
-        SELECT
-            COUNT(*) as total,
-            SUM(CASE WHEN test_status = 'Pass' THEN 1 ELSE 0 END) as passed,
-            SUM(CASE WHEN test_status = 'Fail' THEN 1 ELSE 0 END) as failed,
-            SUM(CASE WHEN test_status = 'Blocked' THEN 1 ELSE 0 END) as blocked,
-            SUM(CASE WHEN test_status = 'Skipped' THEN 1 ELSE 0 END) as skipped
-        FROM uat_test_cases
-        WHERE uat_cycle_id = ?
-    """, (cycle_id,))
+    if not ESBUILD:
+        return None
 
-    row = cursor.fetchone()
-    total = row[0]
-    executed = row[1] + row[2] + row[3] + row[4]
-    pct = round((executed / total) * 100) if total > 0 else 0
+    try:
+        result = subprocess.run(
+            [ESBUILD, "--loader=jsx", "--minify"],
+            input=jsx, capture_output=True, text=True, timeout=60
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        print(f"   Warning: esbuild failed ({e}); using in-browser Babel")
+        return None
 
-    return {
-        'total': total,
-        'passed': row[1],
-        'failed': row[2],
-        'blocked': row[3],
-        'skipped': row[4],
-        'not_run': total - executed,
-        'executed': executed,
-        'percent_complete': pct
-    }
+    if result.returncode != 0:
+        print(f"   Warning: esbuild failed; using in-browser Babel\n{result.stderr}")
+        return None
 
+    return result.stdout
 
-def generate_dashboard_html(cycle_info: dict, overall: dict, testers: list) -> str:
+
+def generate_dashboard_html(cycle_info: dict, overall: dict, testers: list, out) -> None:
     """
     PURPOSE:
         Generate the dashboard HTML content.
@@ -169,13 +301,16 @@ def generate_dashboard_html(cycle_info: dict, overall: dict, testers: list) -> s
         cycle_info (dict): Cycle metadata
         overall (dict): Overall statistics
         testers (list): Per-tester statistics
+        out: Writable text stream (e.g. the open output file)
 
     RETURNS:
-        str: Complete HTML content for the dashboard
+        None - the complete HTML page is written to out
 
     WHY THIS APPROACH:
         Using React + Tailwind for consistency with the tracker templates.
         The dashboard is a static page that can be regenerated on demand.
+        Writing the page in pieces to out avoids assembling one more copy
+        of the whole document as a string before it hits the file.
     """
     # Build tester rows HTML
     tester_rows = []
@@ -187,55 +322,35 @@ def generate_dashboard_html(cycle_info: dict, overall: dict, testers: list) -> s
         elif t['failed'] > 0:
             row_class = 'bg-red-50'
 
-        tester_rows.append(f"""
-            <tr className="{row_class}">
-              <td className="px-4 py-3 whitespace-nowrap">
-                <div className="font-medium text-gray-900">{t['name']}</div>
-                <div className="text-xs text-gray-500">{t['email']}</div>
-              </td>
-              <td className="px-4 py-3 text-center">
-                <div className="flex items-center justify-center gap-1">
-                  <div className="w-16 h-2 bg-gray-200 rounded-full overflow-hidden">
-                    <div className="bg-blue-500 h-full" style={{{{ width: '{t['percent_complete']}%' }}}} />
-                  </div>
-                  <span className="text-sm font-medium">{t['percent_complete']}%</span>
-                </div>
-              </td>
-              <td className="px-4 py-3 text-center text-green-600 font-medium">{t['passed']}</td>
-              <td className="px-4 py-3 text-center text-red-600 font-medium">{t['failed']}</td>
-              <td className="px-4 py-3 text-center text-amber-600">{t['blocked']}</td>
-              <td className="px-4 py-3 text-center text-gray-400">{t['not_run']}</td>
-              <td className="px-4 py-3 text-center text-xs text-gray-500">
-                {t['last_tested'][:10] if t['last_tested'] else '-'}
-              </td>
-            </tr>""")
+        # Display-only fields go in a merged copy - t itself is embedded
+        # as JSON below and must stay unchanged
+        tester_rows.append(TESTER_ROW_TEMPLATE.format_map({
+            **t,
+            'row_class': row_class,
+            'last_tested_day': (t['last_tested'] or '-')[:10]
+        }))
 
     tester_rows_html = '\n'.join(tester_rows)
 
+    # All embedded data in one compact JSON blob - a single serialization
+    # pass, and minified separators keep the published page smaller
+    payload = {
+        'cycle': cycle_info,
+        'overall': overall,
+        'testers': testers,
+        'generatedAt': datetime.now().isoformat()
+    }
+    data_json = json.dumps(payload, separators=(',', ':'), default=str)
+
     # Calculate pass rate
     pass_rate = round((overall['passed'] / overall['executed']) * 100) if overall['executed'] > 0 else 0
 
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{cycle_info['name']} - UAT Dashboard</title>
-    <script src="https://unpkg.com/react@18/umd/react.production.min.js"></script>
-    <script src="https://unpkg.com/react-dom@18/umd/react-dom.production.min.js"></script>
-    <script src="https://unpkg.com/@babel/standalone/babel.min.js"></script>
-    <script src="https://cdn.tailwindcss.com"></script>
-</head>
-<body class="bg-gray-100">
-    <div id="root"></div>
-
-    <script type="text/babel">
-    const Dashboard = () => {{
+    # The dashboard component (JSX) - precompiled by esbuild if available,
+    # otherwise shipped as text/babel for in-browser compilation
+    jsx = f"""    const Dashboard = () => {{
       // Data embedded at generation time
-      const cycle = {json.dumps(cycle_info)};
-      const overall = {json.dumps(overall)};
-      const testers = {json.dumps(testers)};
-      const generatedAt = "{datetime.now().isoformat()}";
+      const DATA = {data_json};
+      const {{ cycle, overall, testers, generatedAt }} = DATA;
 
       return (
         <div className="max-w-6xl mx-auto py-8 px-4">
@@ -379,11 +494,38 @@ def generate_dashboard_html(cycle_info: dict, overall: dict, testers: list) -> s
     }};
 
     ReactDOM.render(<Dashboard />, document.getElementById('root'));
-    </script>
+"""
+
+    compiled = compile_jsx(jsx)
+    if compiled:
+        script_body = compiled
+        script_type = ''
+        babel_script = ''
+    else:
+        script_body = jsx
+        script_type = ' type="text/babel"'
+        babel_script = '    <script src="https://unpkg.com/@babel/standalone/babel.min.js"></script>\n'
+
+    out.write(f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{cycle_info['name']} - UAT Dashboard</title>
+    <script src="https://unpkg.com/react@18/umd/react.production.min.js"></script>
+    <script src="https://unpkg.com/react-dom@18/umd/react-dom.production.min.js"></script>
+{babel_script}    <script src="https://cdn.tailwindcss.com"></script>
+</head>
+<body class="bg-gray-100">
+    <div id="root"></div>
+
+    <script{script_type}>
+""")
+    out.write(script_body)
+    out.write("""    </script>
 </body>
 </html>
-"""
-    return html
+""")
 
 
 def main():
@@ -395,15 +537,23 @@ def main():
         python scripts/generate_dashboard.py UAT-NCCN-Q4-2025
     """
     if len(sys.argv) < 2:
-        print("Usage: python scripts/generate_dashboard.py <cycle_id>")
+        print("Usage: python scripts/generate_dashboard.py <cycle_id> [--force]")
         print("")
         print("Generate a UAT progress dashboard for the specified cycle.")
+        print("Skipped when the cycle's progress hasn't changed since the")
+        print("last run - pass --force to regenerate anyway.")
         print("")
         print("Example:")
         print("  python scripts/generate_dashboard.py UAT-NCCN-Q4-2025")
         sys.exit(1)
 
     cycle_id = sys.argv[1]
+    force = '--force' in sys.argv[2:]
+
+    # Use cycle_id slug for the filename
+    slug = cycle_id.lower().replace('_', '-')
+    output_file = OUTPUT_DIR / f"dashboard-{slug}.html"
+    signature_file = CACHE_DIR / f"{slug}.sig"
 
     # Verify database exists
     if not DB_PATH.exists():
@@ -411,39 +561,46 @@ def main():
         print("Make sure the data/ symlink is configured correctly.")
         sys.exit(1)
 
-    # Connect to database
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-
-    # Get cycle info
-    cycle_info = get_cycle_info(cursor, cycle_id)
-    if not cycle_info:
-        print(f"Error: Cycle not found: {cycle_id}")
-        conn.close()
-        sys.exit(1)
+    # Connect to database (closed when the block exits, including sys.exit)
+    with open_db(DB_PATH) as conn:
+        # Name-addressable rows (row['passed'] instead of row[2])
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+
+        # Get cycle info
+        cycle_info = get_cycle_info(cursor, cycle_id)
+        if not cycle_info:
+            print(f"Error: Cycle not found: {cycle_id}")
+            sys.exit(1)
+
+        # Get statistics
+        ensure_dashboard_index(cursor)
+        overall, testers = get_cycle_progress(cursor, cycle_id)
+
+    # Nothing changed since the dashboard was last generated?
+    signature = get_data_signature(cycle_info, overall, testers)
+    if (not force and output_file.exists() and signature_file.exists()
+            and signature_file.read_bytes() == signature):
+        print(f"Dashboard up to date (no changes since last run): {output_file}")
+        print("Use --force to regenerate anyway.")
+        return
 
     print(f"Generating dashboard for: {cycle_info['name']}")
-
-    # Get statistics
-    overall = get_overall_stats(cursor, cycle_id)
-    testers = get_tester_progress(cursor, cycle_id)
-
-    conn.close()
-
     print(f"   Total tests: {overall['total']}")
     print(f"   Executed: {overall['executed']} ({overall['percent_complete']}%)")
     print(f"   Testers: {len(testers)}")
 
-    # Generate HTML
-    html = generate_dashboard_html(cycle_info, overall, testers)
-
-    # Write to output file
-    # Use cycle_id slug for the filename
-    slug = cycle_id.lower().replace('_', '-')
-    output_file = OUTPUT_DIR / f"dashboard-{slug}.html"
-
-    with open(output_file, 'w') as f:
-        f.write(html)
+    # Generate HTML straight into the output file
+    with open(output_file, 'w', encoding='utf-8') as f:
+        generate_dashboard_html(cycle_info, overall, testers, f)
+
+    # Record the signature only after the HTML is safely written.
+    # Write-then-rename so an interrupted run never leaves a partial
+    # signature that would wrongly match next time.
+    CACHE_DIR.mkdir(exist_ok=True)
+    tmp_file = signature_file.with_suffix('.tmp')
+    tmp_file.write_bytes(signature)
+    tmp_file.replace(signature_file)
 
     print(f"\nDashboard generated: {output_file}")
     print(f"\nView at: https://glewis05.github.io/uat_toolkit/dashboard-{slug}.html")
@@ -35,9 +35,22 @@ import json
 import sqlite3
 import sys
 import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
+from _db import open_db
+
+# orjson is optional - a Rust JSON library that serializes much faster than
+# the stdlib. Falls back to stdlib json if not installed.
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 # =====================================================
 # PATH CONFIGURATION
@@ -50,6 +63,12 @@ DOCS_PATH = REPO_ROOT / "docs"
 TEMPLATE_PATH = DOCS_PATH / "templates" / "workflow-tracker-template.html"
 
 
+# slugify() patterns, compiled once: drop anything that isn't a word
+# character, space or hyphen, then collapse space/hyphen runs into one "-"
+_SLUG_STRIP = re.compile(r'[^\w\s-]')
+_SLUG_DASH = re.compile(r'[-\s]+')
+
+
 def slugify(text: str) -> str:
     """
     PURPOSE:
@@ -65,11 +84,64 @@ def slugify(text: str) -> str:
         stringr::str_to_lower() %>% str_replace_all("[^a-z0-9]+", "-")
     """
     text = text.lower().strip()
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[-\s]+', '-', text)
+    text = _SLUG_STRIP.sub('', text)
+    text = _SLUG_DASH.sub('-', text)
     return text
 
 
+def get_tester_info(tester: str) -> dict:
+    """
+    PURPOSE:
+        Derive a tester's display name and file slug from their email.
+
+    PARAMETERS:
+        tester (str): Tester email (e.g., "kim.childers@example.com")
+
+    RETURNS:
+        dict: {"email", "name", "slug"} (e.g., name "Kim Childers",
+              slug "kim-childers")
+
+    WHY THIS APPROACH:
+        Computed once per tester in main() and passed along, so the
+        tracker, the index page and the URL list all use the same values.
+    """
+    name = tester.split('@')[0].replace('.', ' ').title()
+    return {"email": tester, "name": name, "slug": slugify(name)}
+
+
+def ensure_tracker_indexes(cursor) -> None:
+    """
+    PURPOSE:
+        Create the indexes the per-cycle tracker queries read from, if the
+        shared database doesn't have them yet (see database/schema.sql).
+
+    PARAMETERS:
+        cursor: SQLite cursor
+
+    WHY THIS APPROACH:
+        Every query here filters on a cycle and then a tester. With
+        (cycle, tester, ...) indexes SQLite range-scans one cycle's entries
+        in tester order instead of scanning the tables:
+        - uat_test_assignments: covering, so the tester list and the join
+          side of the test query never touch the table
+        - uat_test_cases: the legacy assigned_to path - the same index
+          generate_dashboard.py uses, so no second copy is built
+        - uat_workflow_sections: the LEFT JOIN becomes a B-tree probe
+        IF NOT EXISTS makes this a no-op after the first run.
+    """
+    cursor.executescript("""
+        CREATE INDEX IF NOT EXISTS idx_assignments_cycle_tester
+            ON uat_test_assignments(cycle_id, assigned_to, test_id, assignment_type);
+
+        CREATE INDEX IF NOT EXISTS idx_tc_cycle_assignee_status
+            ON uat_test_cases(uat_cycle_id, assigned_to, test_status, tested_date)
+            WHERE uat_cycle_id IS NOT NULL;
+
+        CREATE INDEX IF NOT EXISTS idx_ws_section_code
+            ON uat_workflow_sections(section_code);
+    """)
+
+
 def get_cycle_info(cursor, cycle_id: str) -> dict:
     """
     PURPOSE:
@@ -148,28 +220,80 @@ def get_testers_for_cycle(cursor, cycle_id: str) -> list:
     return result
 
 
-def get_tests_for_tester(cursor, cycle_id: str, tester: str) -> list:
+# Display fallbacks for empty test columns (NULL or '').
+# Columns not listed here are passed through as-is.
+TEST_DEFAULTS = {
+    "workflow_order": 0,
+    "test_type": "happy_path",
+    "test_steps": "",
+    "expected_results": "",
+    "prerequisites": "",
+    "priority": "Should Have",
+}
+
+# Tracker-side fields every test starts with
+TEST_EXTRAS = {
+    "context_hint": "",
+    "test_status": "Not Run",
+}
+
+
+def _row_to_test(row) -> dict:
     """
     PURPOSE:
-        Get all test cases assigned to a specific tester.
+        Convert one test query row into the test dict the tracker embeds.
+
+    PARAMETERS:
+        row (sqlite3.Row): Result row from get_tests_by_tester() -
+                           assigned_to first, then the test columns
+
+    RETURNS:
+        dict: Test case with display defaults filled in
+    """
+    test = dict(row)
+    del test["assigned_to"]
+
+    # Use workflow_section if set, otherwise fall back to category
+    test["workflow_section"] = test["workflow_section"] or test["category"] or "OTHER"
+
+    return {
+        **test,
+        **{col: fallback for col, fallback in TEST_DEFAULTS.items() if not test[col]},
+        **TEST_EXTRAS,
+    }
+
+
+def get_tests_by_tester(cursor, cycle_id: str) -> dict:
+    """
+    PURPOSE:
+        Get the test cases assigned to every tester in a cycle.
 
     PARAMETERS:
         cursor: SQLite cursor
         cycle_id (str): The cycle identifier
-        tester (str): Tester email address
 
     RETURNS:
-        list: List of test case dictionaries
+        dict: Tester email -> list of test case dictionaries, each list in
+              workflow order
 
     WHY THIS APPROACH:
+        One query for the whole cycle, grouped by tester in Python, instead
+        of one query per tester - the round trips (not the rows) were the
+        cost.
         First tries uat_test_assignments table (supports overlap/cross-check).
         Falls back to uat_test_cases.assigned_to for backward compatibility.
         The assignment_type from the assignments table indicates if this is
-        a 'primary' or 'cross_check' assignment.
+        a 'primary' or 'cross_check' assignment. A tester's tracker lists
+        both, with cross-checks labelled; the dashboard's per-tester totals
+        count primary assignments only (uat_test_cases.assigned_to).
+
+    R EQUIVALENT:
+        split(tests, tests$assigned_to)
     """
     # Try new assignments table first
     cursor.execute("""
         SELECT
+            a.assigned_to,
             tc.test_id,
             tc.title,
             tc.workflow_section,
@@ -190,8 +314,8 @@ def get_tests_for_tester(cursor, cycle_id: str, tester: str) -> list:
         FROM uat_test_assignments a
         JOIN uat_test_cases tc ON a.test_id = tc.test_id
         WHERE a.cycle_id = ?
-        AND a.assigned_to = ?
         ORDER BY
+            a.assigned_to,
             CASE tc.workflow_section
                 WHEN 'P4M' THEN 1
                 WHEN 'PR4M' THEN 2
@@ -205,7 +329,7 @@ def get_tests_for_tester(cursor, cycle_id: str, tester: str) -> list:
             END,
             tc.workflow_order,
             tc.test_id
-    """, (cycle_id, tester))
+    """, (cycle_id,))
 
     rows = cursor.fetchall()
 
@@ -213,6 +337,7 @@ def get_tests_for_tester(cursor, cycle_id: str, tester: str) -> list:
     if not rows:
         cursor.execute("""
             SELECT
+                assigned_to,
                 test_id,
                 title,
                 workflow_section,
@@ -232,8 +357,10 @@ def get_tests_for_tester(cursor, cycle_id: str, tester: str) -> list:
                 patient_conditions
             FROM uat_test_cases
             WHERE uat_cycle_id = ?
-            AND assigned_to = ?
+            AND assigned_to IS NOT NULL
+            AND assigned_to != ''
             ORDER BY
+                assigned_to,
                 CASE workflow_section
                     WHEN 'P4M' THEN 1
                     WHEN 'PR4M' THEN 2
@@ -247,112 +374,104 @@ def get_tests_for_tester(cursor, cycle_id: str, tester: str) -> list:
                 END,
                 workflow_order,
                 test_id
-        """, (cycle_id, tester))
+        """, (cycle_id,))
         rows = cursor.fetchall()
 
-    tests = []
+    tests_by_tester = defaultdict(list)
     for row in rows:
-        # Use workflow_section if set, otherwise fall back to category
-        section = row[2] if row[2] else row[4]
-
-        tests.append({
-            "test_id": row[0],
-            "title": row[1],
-            "workflow_section": section or "OTHER",
-            "workflow_order": row[3] or 0,
-            "category": row[4],
-            "test_type": row[5] or "happy_path",
-            "test_steps": row[6] or "",
-            "expected_results": row[7] or "",
-            "prerequisites": row[8] or "",
-            "priority": row[9] or "Should Have",
-            "compliance_framework": row[10],
-            "assignment_type": row[11],
-            "profile_id": row[12],
-            "platform": row[13],
-            "persona": row[14],
-            "target_rule": row[15],
-            "patient_conditions": row[16],
-            "context_hint": "",
-            "test_status": "Not Run"
-        })
+        tests_by_tester[row['assigned_to']].append(_row_to_test(row))
 
-    return tests
+    return tests_by_tester
 
 
-def get_workflow_sections(cursor, cycle_id: str, tester: str) -> list:
+def get_section_metadata(cursor) -> dict:
     """
     PURPOSE:
-        Get workflow sections that have tests for this tester.
+        Load the workflow section reference table.
 
     PARAMETERS:
         cursor: SQLite cursor
-        cycle_id (str): The cycle identifier
-        tester (str): Tester email address
 
     RETURNS:
-        list: List of section dictionaries with metadata
+        dict: Section code -> (section_name, section_description,
+              guidance_text, display_order)
 
     WHY THIS APPROACH:
-        First tries uat_test_assignments table, falls back to uat_test_cases.assigned_to.
+        The table holds a handful of rows - reading it once and looking
+        sections up in Python replaces a per-tester JOIN + DISTINCT query.
     """
-    # Try new assignments table first
     cursor.execute("""
-        SELECT DISTINCT
-            COALESCE(tc.workflow_section, tc.category) as section,
-            ws.section_name,
-            ws.section_description,
-            ws.guidance_text,
-            ws.display_order
-        FROM uat_test_assignments a
-        JOIN uat_test_cases tc ON a.test_id = tc.test_id
-        LEFT JOIN uat_workflow_sections ws
-            ON ws.section_code = COALESCE(tc.workflow_section, tc.category)
-        WHERE a.cycle_id = ?
-        AND a.assigned_to = ?
-        ORDER BY COALESCE(ws.display_order, 99)
-    """, (cycle_id, tester))
+        SELECT section_code, section_name, section_description,
+               guidance_text, display_order
+        FROM uat_workflow_sections
+    """)
+    return {row[0]: row[1:] for row in cursor.fetchall()}
 
-    rows = cursor.fetchall()
 
-    # Fall back to legacy if no results
-    if not rows:
-        cursor.execute("""
-            SELECT DISTINCT
-                COALESCE(tc.workflow_section, tc.category) as section,
-                ws.section_name,
-                ws.section_description,
-                ws.guidance_text,
-                ws.display_order
-            FROM uat_test_cases tc
-            LEFT JOIN uat_workflow_sections ws
-                ON ws.section_code = COALESCE(tc.workflow_section, tc.category)
-            WHERE tc.uat_cycle_id = ?
-            AND tc.assigned_to = ?
-            ORDER BY COALESCE(ws.display_order, 99)
-        """, (cycle_id, tester))
-        rows = cursor.fetchall()
+def get_tester_sections(tests: list, section_metadata: dict) -> list:
+    """
+    PURPOSE:
+        Get the workflow sections that a tester's tests fall into.
 
-    sections = []
-    seen = set()
+    PARAMETERS:
+        tests (list): The tester's test dicts (from get_tests_by_tester)
+        section_metadata (dict): From get_section_metadata()
 
-    for row in rows:
-        code = row[0]
-        if not code or code in seen:
-            continue
-        seen.add(code)
+    RETURNS:
+        list: Section dictionaries, ordered by display_order (sections
+              without one last)
 
+    WHY THIS APPROACH:
+        The tests already carry their section code, so the sections come
+        from the loaded rows instead of another query. Every test's section
+        is listed - including "OTHER" for tests with neither a workflow
+        section nor a category - so no assigned test is left without a
+        section to render under.
+    """
+    # Unique codes in first-seen order; sorted() is stable, so codes with
+    # the same display_order keep the tests' order
+    codes = dict.fromkeys(test["workflow_section"] for test in tests)
+    no_metadata = (None, None, None, None)
+
+    sections = []
+    for code in sorted(codes, key=lambda c: _display_order(section_metadata.get(c, no_metadata))):
+        name, description, guidance, _ = section_metadata.get(code, no_metadata)
         sections.append({
             "code": code,
-            "name": row[1] or code,
-            "description": row[2] or f"Tests in {code} category",
-            "guidance": row[3] or "Complete these tests in order.",
+            "name": name or code,
+            "description": description or f"Tests in {code} category",
+            "guidance": guidance or "Complete these tests in order.",
             "icon": get_section_icon(code)
         })
 
     return sections
 
 
+def _display_order(metadata: tuple) -> int:
+    """Sort key for a section's metadata row - no display_order sorts last."""
+    display_order = metadata[3]
+    return 99 if display_order is None else display_order
+
+
+_SECTION_ICONS = {
+    # Feature UAT sections
+    "P4M": "🩺",
+    "PR4M": "🔬",
+    "GRX": "🧬",
+    "DRAFT": "💾",
+    "EDGE": "🔍",
+    "AUTH": "🔐",
+    "DASH": "📊",
+    # NCCN validation sections
+    "NCCN": "📋",
+    "POS": "✅",
+    "NEG": "❌",
+    "DEP": "⚠️",
+    # Generic
+    "OTHER": "📝"
+}
+
+
 def get_section_icon(code: str) -> str:
     """
     PURPOSE:
@@ -364,132 +483,230 @@ def get_section_icon(code: str) -> str:
     RETURNS:
         str: Emoji icon
     """
-    icons = {
-        # Feature UAT sections
-        "P4M": "🩺",
-        "PR4M": "🔬",
-        "GRX": "🧬",
-        "DRAFT": "💾",
-        "EDGE": "🔍",
-        "AUTH": "🔐",
-        "DASH": "📊",
-        # NCCN validation sections
-        "NCCN": "📋",
-        "POS": "✅",
-        "NEG": "❌",
-        "DEP": "⚠️",
-        # Generic
-        "OTHER": "📝"
-    }
-    return icons.get(code, "📝")
+    return _SECTION_ICONS.get(code, "📝")
+
 
+# Data blocks in the tracker template, in template order. Each is wrapped
+# in /*<<<NAME>>>*/ ... /*<<<END_NAME>>>*/ marker comments.
+TEMPLATE_BLOCKS = ("UAT_CONFIG", "WORKFLOW_SECTIONS", "TEST_CASES_DATA")
 
-def escape_js_string(s: str) -> str:
+# Page title in the template, swapped for the cycle and tester name
+TEMPLATE_TITLE = "<title>UAT Tracker Template</title>"
+
+
+def split_template(template: str) -> tuple:
     """
     PURPOSE:
-        Escape a string for safe inclusion in JavaScript.
+        Cut the tracker template into the static text around its three
+        marked data blocks.
 
     PARAMETERS:
-        s (str): String to escape
+        template (str): Tracker template HTML
+
+    RETURNS:
+        tuple: (prefix, mid1, mid2, suffix) - the text before UAT_CONFIG,
+               between the blocks, and after TEST_CASES_DATA. Each block is
+               dropped together with its markers.
+
+    WHY THIS APPROACH:
+        Explicit markers found with str.find() replace three regex scans
+        with lazy multi-line patterns - and the split pieces can be
+        joined with the data in one pass.
+    """
+    segments = []
+    position = 0
+    for name in TEMPLATE_BLOCKS:
+        start_marker = f"/*<<<{name}>>>*/"
+        end_marker = f"/*<<<END_{name}>>>*/"
+        start = template.find(start_marker, position)
+        end = template.find(end_marker, start)
+        if start == -1 or end == -1:
+            raise ValueError(f"Template is missing the {name} block markers: {TEMPLATE_PATH}")
+        segments.append(template[position:start])
+        position = end + len(end_marker)
+    segments.append(template[position:])
+    return tuple(segments)
+
+
+@lru_cache(maxsize=1)
+def _load_template() -> str:
+    """
+    PURPOSE:
+        Read the tracker template, once per process.
 
     RETURNS:
-        str: Escaped string safe for JS
+        str: Template HTML
+
+    WHY THIS APPROACH:
+        Every tester's tracker is built from the same file - reading it
+        once saves an open/read per tester.
     """
-    if not s:
-        return ""
-    # Escape backslashes first, then quotes and newlines
-    s = s.replace("\\", "\\\\")
-    s = s.replace("'", "\\'")
-    s = s.replace('"', '\\"')
-    s = s.replace("\n", "\\n")
-    s = s.replace("\r", "")
-    return s
+    if not TEMPLATE_PATH.exists():
+        raise FileNotFoundError(f"Template not found: {TEMPLATE_PATH}")
 
+    with open(TEMPLATE_PATH, 'r', encoding='utf-8') as f:
+        return f.read()
 
-def generate_tracker_html(cycle_info: dict, tester: str, tests: list,
-                          sections: list, formspree_id: str = None) -> str:
+
+@lru_cache(maxsize=1)
+def _template_segments() -> tuple:
+    """
+    PURPOSE:
+        Split the cached template around its title and data blocks and
+        encode the static pieces, once per process.
+
+    RETURNS:
+        tuple: (head, prefix, mid1, mid2, suffix) as UTF-8 bytes - head is
+               the text before the <title>, prefix the rest up to UAT_CONFIG
+
+    WHY THIS APPROACH:
+        The static text is most of the page and the same for every tester,
+        so only the title and the three data blocks are encoded per tracker.
+    """
+    prefix, mid1, mid2, suffix = split_template(_load_template())
+    head, title, prefix = prefix.partition(TEMPLATE_TITLE)
+    if not title:
+        raise ValueError(f"Template is missing {TEMPLATE_TITLE}: {TEMPLATE_PATH}")
+    return tuple(segment.encode('utf-8') for segment in (head, prefix, mid1, mid2, suffix))
+
+
+# The embedded data is only read by the page's JavaScript - no indentation,
+# no spaces after separators, and non-ASCII text (names, emoji icons) kept
+# as-is instead of \uXXXX escapes. The file is written as UTF-8.
+EMBED_JSON_OPTS = {"separators": (',', ':'), "ensure_ascii": False}
+
+
+def dumps_embedded(data) -> bytes:
+    """
+    PURPOSE:
+        Serialize tracker data as compact UTF-8 JSON, with orjson when it
+        is installed.
+
+    RETURNS:
+        bytes: The JSON, ready to write to the binary output file
+
+    WHY THIS APPROACH:
+        The tests array is the biggest serialization per tracker. orjson
+        returns UTF-8 bytes directly (no str to encode afterwards) and
+        produces the same text as json.dumps(**EMBED_JSON_OPTS), so the
+        page is identical either way.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, **EMBED_JSON_OPTS).encode('utf-8')
+
+
+@lru_cache(maxsize=32)
+def _dump_sections(sections_key: tuple) -> bytes:
+    """
+    PURPOSE:
+        Build the WORKFLOW_SECTIONS statement for one set of sections.
+
+    PARAMETERS:
+        sections_key (tuple): The sections as a tuple of (field, value)
+                              item tuples - hashable, so it can key the cache
+
+    RETURNS:
+        bytes: The JavaScript const declaration, UTF-8 encoded
+
+    WHY THIS APPROACH:
+        Testers in a cycle mostly share the same few section lists, so
+        each distinct list is serialized once per run instead of once per
+        tester. Keying on the full contents (not just the codes) means a
+        cached entry can never be stale.
+    """
+    sections = [dict(items) for items in sections_key]
+    return b"const WORKFLOW_SECTIONS = " + dumps_embedded(sections) + b";"
+
+
+def generate_tracker_html(cycle_info: dict, tester: dict, tests: list,
+                          sections: list, out, formspree_id: str = None) -> None:
     """
     PURPOSE:
         Generate the complete HTML tracker file for one tester.
 
     PARAMETERS:
         cycle_info (dict): UAT cycle metadata
-        tester (str): Tester email address
+        tester (dict): Tester email, name and slug (from get_tester_info())
         tests (list): List of test cases assigned to this tester
         sections (list): Workflow sections for this tester's tests
+        out: Writable binary stream (e.g. the output file opened 'wb')
         formspree_id (str): Optional Formspree form ID for submission
 
     RETURNS:
-        str: Complete HTML content for the tracker
+        None - the complete HTML page is written to out, UTF-8 encoded
 
     WHY THIS APPROACH:
         We read the template file and inject the tester-specific
         configuration and test data. This keeps the React/JS logic
         in one place (the template) while customizing the data.
+        Writing the pieces straight to out avoids assembling the whole
+        page as one more string before it hits the file.
     """
-    # Parse tester name from email
-    tester_name = tester.split('@')[0].replace('.', ' ').title()
-    tester_slug = slugify(tester_name)
-
-    # Build JavaScript configuration
-    config_js = f"""const UAT_CONFIG = {{
-      id: '{escape_js_string(cycle_info["cycle_id"])}-{tester_slug}',
-      name: '{escape_js_string(cycle_info["cycle_name"])}',
-      target_date: '{escape_js_string(cycle_info["target_date"])}',
-      tester_default: '{escape_js_string(tester_name)}',
-      tester_email: '{escape_js_string(tester)}',
-      formspree_id: {f"'{formspree_id}'" if formspree_id else 'null'},
-      localStorage_key: 'uat_{slugify(cycle_info["cycle_id"])}_{tester_slug}'
-    }};"""
+    tester_name = tester["name"]
+    tester_slug = tester["slug"]
+
+    # Build JavaScript configuration - json.dumps() quotes and escapes every
+    # value (JSON is valid JavaScript), and None becomes null
+    config = {
+        "id": f"{cycle_info['cycle_id']}-{tester_slug}",
+        "name": cycle_info["cycle_name"],
+        "target_date": cycle_info["target_date"],
+        "tester_default": tester_name,
+        "tester_email": tester["email"],
+        "formspree_id": formspree_id or None,
+        "localStorage_key": f"uat_{slugify(cycle_info['cycle_id'])}_{tester_slug}"
+    }
+    config_js = "const UAT_CONFIG = " + json.dumps(config, indent=2) + ";"
 
-    # Build sections JavaScript
-    sections_js = "const WORKFLOW_SECTIONS = " + json.dumps(sections, indent=2) + ";"
+    # Build sections JavaScript (shared across testers with the same sections)
+    sections_js = _dump_sections(tuple(tuple(section.items()) for section in sections))
 
     # Build tests JavaScript
-    tests_js = "const TEST_CASES_DATA = " + json.dumps(tests, indent=2) + ";"
-
-    # Read template
-    if not TEMPLATE_PATH.exists():
-        raise FileNotFoundError(f"Template not found: {TEMPLATE_PATH}")
-
-    with open(TEMPLATE_PATH, 'r') as f:
-        template = f.read()
-
-    # Replace placeholders using regex
-    # Using lambda to avoid issues with backslashes in replacement strings
-    # (json.dumps may produce unicode escapes like \u0000 that re.sub would misinterpret)
-
-    # Replace UAT_CONFIG block
-    template = re.sub(
-        r'const UAT_CONFIG = \{[^}]+\};',
-        lambda m: config_js,
-        template
-    )
-
-    # Replace WORKFLOW_SECTIONS block (handles multiline)
-    template = re.sub(
-        r'const WORKFLOW_SECTIONS = \[[\s\S]*?\n    \];',
-        lambda m: sections_js,
-        template
-    )
+    tests_js = b"const TEST_CASES_DATA = " + dumps_embedded(tests) + b";"
+
+    # Page title for this tracker
+    title = f'<title>{cycle_info["cycle_name"]} - {tester_name}</title>'
+
+    # Static template pieces and the data blocks are already bytes - only
+    # this tester's title and config are encoded here
+    head, prefix, mid1, mid2, suffix = _template_segments()
+    out.write(head)
+    out.write(title.encode('utf-8'))
+    out.write(prefix)
+    out.write(config_js.encode('utf-8'))
+    out.write(mid1)
+    out.write(sections_js)
+    out.write(mid2)
+    out.write(tests_js)
+    out.write(suffix)
+
+
+def write_tracker(task: tuple) -> int:
+    """
+    PURPOSE:
+        Render one tester's tracker and write it to disk.
 
-    # Replace TEST_CASES_DATA block (handles multiline)
-    template = re.sub(
-        r'const TEST_CASES_DATA = \[[\s\S]*?\n    \];',
-        lambda m: tests_js,
-        template
-    )
+    PARAMETERS:
+        task (tuple): (cycle_info, tester, tests, sections, formspree_id,
+                      output_path) - everything generate_tracker_html()
+                      needs, so this can run on a worker thread
 
-    # Update the page title
-    template = template.replace(
-        '<title>UAT Tracker Template</title>',
-        f'<title>{cycle_info["cycle_name"]} - {tester_name}</title>'
-    )
+    RETURNS:
+        int: Number of tests in the tracker
 
-    return template
+    R EQUIVALENT:
+        The function you'd hand to furrr::future_walk() - plain data in,
+        file out, no database handle.
+    """
+    cycle_info, tester, tests, sections, formspree_id, output_path = task
+    # Binary, buffered - the pieces are encoded once and skip the text layer
+    with open(output_path, 'wb') as f:
+        generate_tracker_html(cycle_info, tester, tests, sections, f, formspree_id)
+    return len(tests)
 
 
-def generate_index_html(cycle_info: dict, testers: list,
+def generate_index_html(cycle_info: dict, tester_info: dict,
                         tester_test_counts: dict) -> str:
     """
     PURPOSE:
@@ -497,34 +714,40 @@ def generate_index_html(cycle_info: dict, testers: list,
 
     PARAMETERS:
         cycle_info (dict): UAT cycle metadata
-        testers (list): List of tester email addresses
-        tester_test_counts (dict): Map of tester -> test count
+        tester_info (dict): Tester email -> get_tester_info() dict, in
+                            display order
+        tester_test_counts (dict): Map of tester -> (primary, cross_check)
+                                   test counts
 
     RETURNS:
         str: HTML content for the index page
     """
-    # Calculate total tests
-    total_tests = sum(tester_test_counts.values())
-
-    # Build tester links
-    tester_links = ""
-    for tester in testers:
-        tester_name = tester.split('@')[0].replace('.', ' ').title()
-        tester_slug = slugify(tester_name)
-        test_count = tester_test_counts.get(tester, 0)
-
-        tester_links += f"""
+    # Calculate total tests - each test has exactly one primary tester, so
+    # this matches the cycle's test count (cross-checks are extra passes)
+    total_tests = sum(primary for primary, _ in tester_test_counts.values())
+
+    # Build tester links (collected in a list and joined once - += on a
+    # string copies everything built so far on every pass)
+    link_parts = []
+    for tester, info in tester_info.items():
+        tester_name = info["name"]
+        tester_slug = info["slug"]
+        test_count, cross_check_count = tester_test_counts.get(tester, (0, 0))
+        cross_check_note = f" + {cross_check_count} cross-check" if cross_check_count else ""
+
+        link_parts.append(f"""
             <a href="tracker-{tester_slug}.html"
                class="block bg-white rounded-lg shadow p-4 hover:shadow-lg transition-shadow mb-3">
                 <div class="flex items-center justify-between">
                     <div>
                         <h3 class="text-lg font-semibold text-gray-800">{tester_name}</h3>
-                        <p class="text-sm text-gray-500">{test_count} tests assigned</p>
+                        <p class="text-sm text-gray-500">{test_count} tests assigned{cross_check_note}</p>
                     </div>
                     <span class="text-blue-500 text-xl">→</span>
                 </div>
             </a>
-"""
+""")
+    tester_links = "".join(link_parts)
 
     # Build dashboard link (links to cycle dashboard in parent folder)
     dashboard_slug = slugify(cycle_info['cycle_id'])
@@ -553,7 +776,7 @@ def generate_index_html(cycle_info: dict, testers: list,
                 <span class="text-xl">📊</span>
                 <div>
                     <span class="font-semibold">View Progress Dashboard</span>
-                    <span class="text-blue-200 ml-2 text-sm">{len(testers)} testers | {total_tests} tests</span>
+                    <span class="text-blue-200 ml-2 text-sm">{len(tester_info)} testers | {total_tests} tests</span>
                 </div>
             </a>
         </div>
@@ -620,8 +843,8 @@ def update_main_index(cursor) -> str:
         ORDER BY c.created_date DESC
     """)
 
-    # Build cycle cards
-    cycle_links = ""
+    # Build cycle cards (joined once at the end, as in generate_index_html)
+    card_parts = []
     for row in cursor.fetchall():
         cycle_id, name, target_date, status, tester_count, test_count = row
         folder = slugify(cycle_id)
@@ -629,7 +852,7 @@ def update_main_index(cursor) -> str:
 
         # Only link to folder if it has testers assigned
         if tester_count > 0:
-            cycle_links += f"""
+            card_parts.append(f"""
             <a href="{folder}/index.html"
                class="block bg-white rounded-lg shadow p-6 hover:shadow-lg transition-shadow border-l-4 border-green-500">
                 <div class="flex items-center justify-between">
@@ -644,9 +867,9 @@ def update_main_index(cursor) -> str:
                     <span class="text-blue-500 text-2xl">→</span>
                 </div>
             </a>
-"""
+""")
         else:
-            cycle_links += f"""
+            card_parts.append(f"""
             <div class="block bg-white rounded-lg shadow p-6 border-l-4 border-gray-300 opacity-60">
                 <div class="flex items-center justify-between">
                     <div>
@@ -661,7 +884,8 @@ def update_main_index(cursor) -> str:
                     <span class="text-gray-300 text-2xl">→</span>
                 </div>
             </div>
-"""
+""")
+    cycle_links = "".join(card_parts)
 
     return f"""<!DOCTYPE html>
 <html lang="en">
@@ -712,84 +936,103 @@ def main(cycle_id: str, formspree_id: str = None):
         print("Make sure the data/ symlink is configured correctly.")
         sys.exit(1)
 
-    # Connect to database
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-
-    # Get cycle info
-    cycle_info = get_cycle_info(cursor, cycle_id)
-    if not cycle_info:
-        print(f"Error: Cycle not found: {cycle_id}")
-        print("\nAvailable cycles:")
-        cursor.execute("SELECT cycle_id, name FROM uat_cycles ORDER BY created_date DESC LIMIT 10")
-        for row in cursor.fetchall():
-            print(f"  - {row[0]}: {row[1]}")
-        conn.close()
-        sys.exit(1)
-
-    print(f"   Cycle: {cycle_info['cycle_name']}")
-    print(f"   Target: {cycle_info['target_date']}")
-
-    # Get testers
-    testers = get_testers_for_cycle(cursor, cycle_id)
-    if not testers:
-        print("Error: No testers assigned to this cycle")
-        print("   Assign testers first using:")
-        print(f"   UPDATE uat_test_cases SET assigned_to = 'email@example.com' WHERE uat_cycle_id = '{cycle_id}'")
-        conn.close()
-        sys.exit(1)
-
-    print(f"   Testers: {len(testers)}")
+    # Connect to database (closed when the block exits, including sys.exit).
+    # Autocommit mode so the reads below can share one explicit transaction.
+    with open_db(DB_PATH, isolation_level=None) as conn:
+        # Name-addressable rows (row['test_id'] instead of row[1])
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        ensure_tracker_indexes(cursor)
+
+        # Every read happens in one deferred transaction: SQLite takes a
+        # single snapshot instead of one per statement, and the trackers,
+        # index and landing page all see the same data
+        cursor.execute("BEGIN")
+
+        # Get cycle info
+        cycle_info = get_cycle_info(cursor, cycle_id)
+        if not cycle_info:
+            print(f"Error: Cycle not found: {cycle_id}")
+            print("\nAvailable cycles:")
+            cursor.execute("SELECT cycle_id, name FROM uat_cycles ORDER BY created_date DESC LIMIT 10")
+            for row in cursor.fetchall():
+                print(f"  - {row[0]}: {row[1]}")
+            sys.exit(1)
+
+        print(f"   Cycle: {cycle_info['cycle_name']}")
+        print(f"   Target: {cycle_info['target_date']}")
+
+        # Get testers
+        testers = get_testers_for_cycle(cursor, cycle_id)
+        if not testers:
+            print("Error: No testers assigned to this cycle")
+            print("   Assign testers first using:")
+            print(f"   UPDATE uat_test_cases SET assigned_to = 'email@example.com' WHERE uat_cycle_id = '{cycle_id}'")
+            sys.exit(1)
+
+        print(f"   Testers: {len(testers)}")
+
+        # Load every tester's tests and the section table in two queries
+        # (the connection stays on this thread - sqlite3 connections can't
+        # be shared with workers)
+        tests_by_tester = get_tests_by_tester(cursor, cycle_id)
+        section_metadata = get_section_metadata(cursor)
+
+        # Main landing page lists all cycles
+        main_index = update_main_index(cursor)
+
+        cursor.execute("COMMIT")
 
     # Create cycle folder
     cycle_folder = DOCS_PATH / slugify(cycle_id)
     cycle_folder.mkdir(exist_ok=True)
     print(f"   Output: docs/{slugify(cycle_id)}/")
 
-    # Generate tracker for each tester
-    tester_test_counts = {}
-    for tester in testers:
-        tester_name = tester.split('@')[0].replace('.', ' ').title()
-        tester_slug = slugify(tester_name)
-
-        # Get tests and sections for this tester
-        tests = get_tests_for_tester(cursor, cycle_id, tester)
-        sections = get_workflow_sections(cursor, cycle_id, tester)
-
-        tester_test_counts[tester] = len(tests)
+    # Display name and slug for each tester, worked out once
+    tester_info = {tester: get_tester_info(tester) for tester in testers}
 
-        # Generate HTML
-        html = generate_tracker_html(cycle_info, tester, tests, sections, formspree_id)
-
-        # Write file
-        output_path = cycle_folder / f"tracker-{tester_slug}.html"
-        with open(output_path, 'w') as f:
-            f.write(html)
-
-        print(f"   Created: tracker-{tester_slug}.html ({len(tests)} tests)")
+    tester_test_counts = {}
+    tasks = []
+    for tester, info in tester_info.items():
+        tests = tests_by_tester.get(tester, [])
+        sections = get_tester_sections(tests, section_metadata)
+
+        cross_check_count = sum(1 for test in tests if test["assignment_type"] == "cross_check")
+        tester_test_counts[tester] = (len(tests) - cross_check_count, cross_check_count)
+
+        output_path = cycle_folder / f"tracker-{info['slug']}.html"
+        tasks.append((cycle_info, info, tests, sections, formspree_id, output_path))
+
+    # Render and write the trackers in parallel - each one is independent.
+    # json.dumps and the UTF-8 encoding hold the GIL, so serialization
+    # still runs one tracker at a time; what overlaps is the file writes,
+    # which release it. Threads rather than processes because that is
+    # enough for the writes, and threads share the cached template instead
+    # of pickling every tester's tests over to a worker. map() returns results in task
+    # order (and re-raises any worker error here), so the log reads the
+    # same as a serial run.
+    workers = min(8, len(tasks))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for task, _ in zip(tasks, executor.map(write_tracker, tasks)):
+            primary, cross_check = tester_test_counts[task[1]["email"]]
+            cross_check_note = f" + {cross_check} cross-check" if cross_check else ""
+            print(f"   Created: {task[-1].name} ({primary} tests{cross_check_note})")
 
     # Generate cycle index page
-    index_html = generate_index_html(cycle_info, testers, tester_test_counts)
-    with open(cycle_folder / "index.html", 'w') as f:
-        f.write(index_html)
+    index_html = generate_index_html(cycle_info, tester_info, tester_test_counts)
+    (cycle_folder / "index.html").write_bytes(index_html.encode('utf-8'))
     print(f"   Created: index.html (tester selection page)")
 
     # Update main index with all cycles
-    main_index = update_main_index(cursor)
-    with open(DOCS_PATH / "index.html", 'w') as f:
-        f.write(main_index)
+    (DOCS_PATH / "index.html").write_bytes(main_index.encode('utf-8'))
     print(f"   Updated: ../index.html (main landing page)")
 
-    conn.close()
-
     # Print tester URLs
     print(f"\nGeneration complete!")
     print(f"\nTester URLs:")
     base_url = "https://glewis05.github.io/uat_toolkit"
-    for tester in testers:
-        tester_name = tester.split('@')[0].replace('.', ' ').title()
-        tester_slug = slugify(tester_name)
-        print(f"   {tester_name}: {base_url}/{slugify(cycle_id)}/tracker-{tester_slug}.html")
+    for info in tester_info.values():
+        print(f"   {info['name']}: {base_url}/{slugify(cycle_id)}/tracker-{info['slug']}.html")
 
 
 if __name__ == "__main__":